@@ -3,28 +3,113 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import signal
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Coroutine, Optional, TypeVar
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from ai_loop.config import get_settings
-from ai_loop.core.logging import log
-from ai_loop.core.artifacts import ArtifactManager
-from ai_loop.core.dashboard import Dashboard, SimpleDashboard
-from ai_loop.core.orchestrator import PipelineOrchestrator
-from ai_loop.integrations.linear import LinearClient
+from ai_loop.core.console import get_console
+from ai_loop.core.logging import flush_logs
 
+if TYPE_CHECKING:
+    from ai_loop.core.artifacts import ArtifactManager
+
+T = TypeVar("T")
+
+# Heavy modules (pydantic, httpx, openai, rich.live) are imported inside each
+# command so `--help` and lightweight commands don't pay their import cost.
 
 app = typer.Typer(
     name="ai-loop",
     help="CLI orchestrator: Linear issues → Claude plans → Codex critique → Claude implementation",
     no_args_is_help=True,
 )
-console = Console()
+
+
+def _artifacts_manager() -> ArtifactManager:
+    """Get the ArtifactManager for the current git repository."""
+    from ai_loop.integrations.git_tools import GitTools
+
+    return _artifacts_manager_at(GitTools().get_repo_root() / "artifacts")
+
+
+@functools.cache
+def _artifacts_manager_at(artifacts_root: Path) -> ArtifactManager:
+    """Get a shared ArtifactManager per artifacts directory."""
+    from ai_loop.core.artifacts import ArtifactManager
+
+    return ArtifactManager(artifacts_root)
+
+
+# Row styles for run statuses in `list-runs` (others render unstyled)
+_STATUS_STYLES = {"success": "green", "failed": "red"}
+
+
+def _truncate(text: str, width: int = 30) -> str:
+    """Truncate text to width characters, marking the cut with '...'."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on uvloop when installed (POSIX only).
+
+    Queued log lines are written before returning or raising, so they land
+    ahead of whatever the command prints next (including a traceback).
+    """
+    try:
+        try:
+            import uvloop
+        except ImportError:
+            return asyncio.run(coro)
+
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    finally:
+        flush_logs()
+
+
+# Signals that trigger graceful cancellation (SIGTERM: `docker stop`;
+# SIGBREAK: Ctrl-Break on Windows)
+_SHUTDOWN_SIGNALS = tuple(
+    getattr(signal, name)
+    for name in ("SIGINT", "SIGTERM", "SIGBREAK")
+    if hasattr(signal, name)
+)
+
+
+def _install_signal_handlers(
+    loop: asyncio.AbstractEventLoop, handler: Callable[[], None]
+) -> Callable[[], None]:
+    """Route shutdown signals to an asyncio-safe handler on the loop.
+
+    Uses loop.add_signal_handler where supported. Windows event loops raise
+    NotImplementedError for it, so fall back to signal.signal and hop back onto
+    the loop with call_soon_threadsafe.
+
+    Returns a function that removes the handlers again.
+    """
+    loop_signals: list[int] = []
+    previous: dict[int, Any] = {}
+
+    for sig in _SHUTDOWN_SIGNALS:
+        try:
+            loop.add_signal_handler(sig, handler)
+            loop_signals.append(sig)
+        except NotImplementedError:
+            previous[sig] = signal.signal(
+                sig, lambda *_: loop.call_soon_threadsafe(handler)
+            )
+
+    def remove() -> None:
+        for sig in loop_signals:
+            loop.remove_signal_handler(sig)
+        for sig, old_handler in previous.items():
+            signal.signal(sig, old_handler)
+
+    return remove
 
 
 def _get_default_bool(env_value: bool | None, default: bool) -> bool:
@@ -45,6 +130,11 @@ def run(
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Verbose output")] = False,
 ) -> None:
     """Run pipeline for a single Linear issue."""
+    from ai_loop.config import get_settings
+    from ai_loop.core.dashboard import SimpleDashboard
+    from ai_loop.core.orchestrator import PipelineOrchestrator
+    from ai_loop.integrations.linear import LinearClient
+
     settings = get_settings()
 
     # Apply defaults from settings
@@ -58,9 +148,9 @@ def run(
     async def run_async():
         # Fetch issue
         linear = LinearClient()
-        console.print(f"[bold]Fetching issue:[/bold] {issue}")
+        get_console().print(f"[bold]Fetching issue:[/bold] {issue}")
         linear_issue = await linear.get_issue(issue)
-        console.print(f"[green]Found:[/green] {linear_issue.title}")
+        get_console().print(f"[green]Found:[/green] {linear_issue.title}")
 
         # Create orchestrator and context
         orchestrator = PipelineOrchestrator(repo_root=repo_root)
@@ -99,7 +189,7 @@ def run(
 
         def on_status_change(c):
             nonlocal current_stage
-            new_stage = c.status.value
+            new_stage = c.status
             if new_stage != current_stage:
                 # Stop previous stage spinner
                 dashboard.stop_stage()
@@ -118,10 +208,10 @@ def run(
             elif verbose:
                 dashboard.event(event_type, data)
 
-        console.print(f"\n[bold cyan]Starting pipeline run:[/bold cyan] {ctx.run_id}")
+        get_console().print(f"\n[bold cyan]Starting pipeline run:[/bold cyan] {ctx.run_id}")
         if dry_run:
-            console.print("[yellow]DRY RUN MODE - no branches or implementation[/yellow]")
-        console.print()
+            get_console().print("[yellow]DRY RUN MODE - no branches or implementation[/yellow]")
+        get_console().print()
 
         # Get event loop for proper signal handling
         loop = asyncio.get_running_loop()
@@ -136,15 +226,7 @@ def run(
                 pipeline_task.cancel()
 
         # Use asyncio's signal handler (runs in event loop context, not as interrupt)
-        loop.add_signal_handler(signal.SIGINT, handle_sigint)
-
-        # Background task to update elapsed time every second
-        async def update_elapsed():
-            while True:
-                await asyncio.sleep(1)
-                dashboard.update_stage()
-
-        elapsed_task = asyncio.create_task(update_elapsed())
+        remove_signal_handlers = _install_signal_handlers(loop, handle_sigint)
 
         # Run pipeline
         try:
@@ -167,19 +249,14 @@ def run(
                 return
             raise  # Re-raise if not from our interrupt
         finally:
-            # Cancel elapsed timer and wait for clean shutdown
-            elapsed_task.cancel()
-            try:
-                await elapsed_task
-            except asyncio.CancelledError:
-                pass
+            # Also cancels the dashboard's elapsed-time timer
             dashboard.stop_stage()
-            loop.remove_signal_handler(signal.SIGINT)
+            remove_signal_handlers()
 
         # Print result
-        console.print()
-        if result.status.value == "success":
-            console.print("[bold green]✓ Pipeline completed successfully![/bold green]")
+        get_console().print()
+        if result.status == "success":
+            get_console().print("[bold green]✓ Pipeline completed successfully![/bold green]")
         else:
             dashboard.show_failure(
                 stage=current_stage or "unknown",
@@ -188,11 +265,11 @@ def run(
                 artifacts_path=str(result.artifacts_dir),
             )
 
-        console.print(f"\nArtifacts: {result.artifacts_dir}")
+        get_console().print(f"\nArtifacts: {result.artifacts_dir}")
         if result.branch_name:
-            console.print(f"Branch: {result.branch_name}")
+            get_console().print(f"Branch: {result.branch_name}")
 
-    asyncio.run(run_async())
+    _run_async(run_async())
 
 
 @app.command()
@@ -214,6 +291,12 @@ def batch(
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Verbose output")] = False,
 ) -> None:
     """Run pipeline for multiple Linear issues with live dashboard."""
+    from ai_loop.config import get_settings
+    from ai_loop.core.dashboard import Dashboard
+    from ai_loop.core.logging import log
+    from ai_loop.core.orchestrator import PipelineOrchestrator
+    from ai_loop.integrations.linear import LinearClient
+
     settings = get_settings()
 
     # Apply defaults
@@ -230,16 +313,16 @@ def batch(
         if issues:
             # Explicit issue IDs provided
             issue_ids = [i.strip() for i in issues.split(",")]
-            console.print(f"[bold]Fetching {len(issue_ids)} issues...[/bold]")
+            get_console().print(f"[bold]Fetching {len(issue_ids)} issues...[/bold]")
             issue_list = []
             for issue_id in issue_ids:
                 try:
                     issue_list.append(await linear.get_issue(issue_id))
                 except Exception as e:
-                    console.print(f"[yellow]Warning: Could not fetch {issue_id}: {e}[/yellow]")
+                    get_console().print(f"[yellow]Warning: Could not fetch {issue_id}: {e}[/yellow]")
         else:
             # Query by filters
-            console.print(f"[bold]Querying Linear issues...[/bold]")
+            get_console().print(f"[bold]Querying Linear issues...[/bold]")
             issue_list = await linear.list_issues(
                 team=team,
                 project=project,
@@ -249,10 +332,10 @@ def batch(
             )
 
         if not issue_list:
-            console.print("[yellow]No issues found matching criteria[/yellow]")
+            get_console().print("[yellow]No issues found matching criteria[/yellow]")
             return
 
-        console.print(f"[green]Found {len(issue_list)} issues[/green]")
+        get_console().print(f"[green]Found {len(issue_list)} issues[/green]")
         log("BATCH", f"Processing {len(issue_list)} issues with concurrency {concurrency}")
 
         # Setup dashboard
@@ -270,6 +353,8 @@ def batch(
                 log("BATCH", f"Starting: {issue.identifier} - {issue.title[:50]}")
                 dashboard.update(issue.identifier, status="planning", last_event="Starting...")
 
+                # Created only once the issue gets a slot, so an interrupted
+                # batch leaves no run directories for issues that never ran
                 ctx = await orchestrator.create_context(
                     issue,
                     dry_run=dry_run,
@@ -293,7 +378,7 @@ def batch(
                         on_status_change=on_status_change,
                         on_event=on_event,
                     )
-                    log("BATCH", f"Completed: {issue.identifier} -> {result.status.value}")
+                    log("BATCH", f"Completed: {issue.identifier} -> {result.status}")
                 except Exception as e:
                     log("BATCH", f"Failed: {issue.identifier} -> {str(e)[:50]}")
                     dashboard.update(
@@ -308,24 +393,46 @@ def batch(
                     if lock_path.exists():
                         lock_path.unlink()
 
-        # Run dashboard and processing concurrently
-        async def run_all():
-            tasks = [process_issue(issue) for issue in issue_list]
-            await asyncio.gather(*tasks)
+        # Ctrl-C / SIGTERM cancels this task; the TaskGroup then cancels every
+        # outstanding pipeline (their finally blocks still write summaries and
+        # release lock files) and the dashboard stops without a final frame.
+        loop = asyncio.get_running_loop()
+        batch_task = asyncio.current_task()
+        interrupted = False
 
-        # Start dashboard and processing
-        dashboard_task = asyncio.create_task(dashboard.run())
-        processing_task = asyncio.create_task(run_all())
+        def handle_sigint():
+            nonlocal interrupted
+            if not interrupted:
+                interrupted = True
+                batch_task.cancel()
 
-        await processing_task
-        dashboard.stop()
-        await dashboard_task
+        remove_signal_handlers = _install_signal_handlers(loop, handle_sigint)
+
+        try:
+            async with dashboard:
+                async with asyncio.TaskGroup() as tg:
+                    for issue in issue_list:
+                        tg.create_task(process_issue(issue))
+        except asyncio.CancelledError:
+            if not interrupted:
+                raise
+            batch_task.uncancel()
+        finally:
+            remove_signal_handlers()
+
+        if interrupted:
+            get_console().print()
+            get_console().print(
+                f"[bold yellow]⚠ Batch interrupted:[/bold yellow] {dashboard.progress.completed} succeeded, "
+                f"{dashboard.progress.failed} failed before stopping"
+            )
+            return
 
         # Print summary
-        console.print()
-        console.print(f"[bold]Batch complete:[/bold] {dashboard.progress.completed} succeeded, {dashboard.progress.failed} failed")
+        get_console().print()
+        get_console().print(f"[bold]Batch complete:[/bold] {dashboard.progress.completed} succeeded, {dashboard.progress.failed} failed")
 
-    asyncio.run(run_batch())
+    _run_async(run_batch())
 
 
 @app.command()
@@ -333,46 +440,45 @@ def watch(
     run_id: Annotated[str, typer.Option("--run-id", "-r", help="Run ID to watch")],
 ) -> None:
     """Tail a run log and show latest status."""
-    from ai_loop.integrations.git_tools import GitTools
-
-    git = GitTools()
-    artifacts = ArtifactManager(git.get_repo_root() / "artifacts")
+    artifacts = _artifacts_manager()
 
-    trace_events = artifacts.read_trace(run_id)
+    # Stream events so long traces start printing immediately
+    trace_events = artifacts.iter_trace(run_id)
+    first_event = next(trace_events, None)
 
-    if not trace_events:
-        console.print(f"[yellow]No trace found for run: {run_id}[/yellow]")
+    if first_event is None:
+        get_console().print(f"[yellow]No trace found for run: {run_id}[/yellow]")
         raise typer.Exit(1)
 
-    console.print(f"[bold]Trace for run:[/bold] {run_id}")
-    console.print()
+    get_console().print(f"[bold]Trace for run:[/bold] {run_id}")
+    get_console().print()
 
-    for event in trace_events:
-        timestamp = event.timestamp.strftime("%H:%M:%S")
-        console.print(f"[dim]{timestamp}[/dim] [{event.stage}] {event.event_type}")
+    for event in itertools.chain([first_event], trace_events):
+        timestamp = event.timestamp.isoformat(timespec="seconds")[11:19]
+        get_console().print(f"[dim]{timestamp}[/dim] [{event.stage}] {event.event_type}")
         if event.data:
             for key, value in event.data.items():
-                console.print(f"        {key}: {value}")
+                get_console().print(f"        {key}: {value}")
 
 
 @app.command("list-runs")
 def list_runs() -> None:
     """List recent runs."""
-    from ai_loop.integrations.git_tools import GitTools
-
     try:
-        git = GitTools()
-        artifacts = ArtifactManager(git.get_repo_root() / "artifacts")
+        artifacts = _artifacts_manager()
     except Exception:
-        console.print("[yellow]Not in a git repository or no artifacts found[/yellow]")
+        get_console().print("[yellow]Not in a git repository or no artifacts found[/yellow]")
         return
 
     runs = artifacts.list_runs()
 
     if not runs:
-        console.print("[dim]No runs found[/dim]")
+        get_console().print("[dim]No runs found[/dim]")
         return
 
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title="Recent Runs")
     table.add_column("Run ID", style="cyan")
     table.add_column("Issue")
@@ -383,25 +489,22 @@ def list_runs() -> None:
     table.add_column("Completed")
 
     for run in runs[:20]:
-        status_style = ""
-        if run.status.value == "success":
-            status_style = "green"
-        elif run.status.value == "failed":
-            status_style = "red"
+        status = run.status
+        style = _STATUS_STYLES.get(status)
 
-        completed = run.completed_at.strftime("%Y-%m-%d %H:%M") if run.completed_at else "-"
+        completed = run.completed_at.isoformat(" ", "minutes")[:16] if run.completed_at else "-"
 
         table.add_row(
-            run.run_id[:30] + "..." if len(run.run_id) > 30 else run.run_id,
+            _truncate(run.run_id),
             run.issue_identifier,
-            f"[{status_style}]{run.status.value}[/{status_style}]" if status_style else run.status.value,
+            Text(status, style=style) if style else status,
             str(run.iterations),
             str(run.final_confidence) if run.final_confidence else "-",
-            run.branch_name[:30] + "..." if len(run.branch_name) > 30 else run.branch_name,
+            _truncate(run.branch_name),
             completed,
         )
 
-    console.print(table)
+    get_console().print(table)
 
 
 @app.command()
@@ -430,7 +533,7 @@ def serve(
     if project:
         repo_root = project.resolve()
         if not repo_root.exists():
-            console.print(f"[red]Error: Project path does not exist: {repo_root}[/red]")
+            get_console().print(f"[red]Error: Project path does not exist: {repo_root}[/red]")
             raise typer.Exit(1)
     else:
         try:
@@ -440,8 +543,8 @@ def serve(
             # Not in a git repo, try last used project
             repo_root = pm.get_last_project()
             if not repo_root:
-                console.print("[red]Error: No project found.[/red]")
-                console.print("Run from a git repository or use --project /path/to/repo")
+                get_console().print("[red]Error: No project found.[/red]")
+                get_console().print("Run from a git repository or use --project /path/to/repo")
                 raise typer.Exit(1)
 
     # Record this project as most recently used
@@ -450,10 +553,10 @@ def serve(
     artifacts_dir = repo_root / "artifacts"
     artifacts_dir.mkdir(exist_ok=True)
 
-    console.print(f"[bold]Starting AI Loop dashboard[/bold]")
-    console.print(f"  Project: {repo_root}")
-    console.print(f"  URL: http://127.0.0.1:{port}")
-    console.print()
+    get_console().print(f"[bold]Starting AI Loop dashboard[/bold]")
+    get_console().print(f"  Project: {repo_root}")
+    get_console().print(f"  URL: http://127.0.0.1:{port}")
+    get_console().print()
 
     if open_browser:
         import webbrowser
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -38,6 +39,12 @@ class Settings(BaseSettings):
         default=2, description="Required stable passes"
     )
 
+    # Trace logging
+    trace_format: Literal["jsonl", "msgpack"] = Field(
+        default="jsonl",
+        description="Trace log format (msgpack needs the 'fast' extra; the web UI tails jsonl only)",
+    )
+
     # Feature flags
     no_linear_writeback_default: bool = Field(
         default=False, description="Disable Linear comment writeback"
@@ -45,6 +52,14 @@ class Settings(BaseSettings):
     use_worktree_default: bool = Field(
         default=True, description="Use git worktree for isolation"
     )
+    worktree_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Reusable worktrees under artifacts/.worktrees (0 = a fresh worktree "
+            "per run; a reused slot is reset with 'git clean -fdx')"
+        ),
+    )
 
     # Optional CI auth
     codex_api_key: str | None = Field(
@@ -57,19 +72,46 @@ class Settings(BaseSettings):
     critique_max_concurrent: int = Field(
         default=3, description="Max concurrent critique API calls"
     )
+    critique_max_diff_chars: int = Field(
+        default=200_000,
+        ge=0,
+        description="Diff size sent to CODE_GATE; larger diffs are cut to whole files (0 = no limit)",
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings, loading from .env if present."""
+    """Get application settings, loading from .env if present.
+
+    Cached for the lifetime of the process; call ``get_settings.cache_clear()``
+    to force a reload (e.g. in tests that change the environment).
+    """
     return Settings()
 
 
+@functools.lru_cache(maxsize=1)
 def get_prompts_dir() -> Path:
     """Get the prompts directory path."""
     # __file__ is src/ai_loop/config.py, go up to ai-loop/ then into prompts/
     return Path(__file__).parent.parent.parent / "prompts"
 
 
+@functools.lru_cache(maxsize=32)
+def _read_prompt(path: Path, mtime_ns: int) -> str:
+    return path.read_text()
+
+
+def load_prompt(prompts_dir: Path, name: str) -> str:
+    """Load ``<prompts_dir>/<name>.md``, cached until the file changes on disk."""
+    path = prompts_dir / f"{name}.md"
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt not found: {path}") from None
+    return _read_prompt(path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
 def get_schemas_dir() -> Path:
     """Get the schemas directory path."""
     return Path(__file__).parent.parent.parent / "schemas"
@@ -2,71 +2,207 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any, Iterator, Literal
 
+from ai_loop.core import fastjson
 from ai_loop.core.models import RunSummary, RunStatus, TraceEvent
 from ai_loop.safety.secrets import redact_secrets
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without the extra
+    msgpack = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from ai_loop.core.models import RunContext
 
+TraceFormat = Literal["jsonl", "msgpack"]
+
+# Trace file name per format. msgpack traces are a sequence of frames, each a
+# little-endian uint32 payload length followed by the packed event.
+TRACE_FILENAMES: dict[str, str] = {"jsonl": "trace.jsonl", "msgpack": "trace.msgpack"}
+_FRAME_HEADER = struct.Struct("<I")
+
+# Trace batching: wait this long after the first queued event, then write
+# everything that has accumulated (up to the batch cap) in one go.
+TRACE_FLUSH_INTERVAL = 0.05
+TRACE_FLUSH_BATCH = 256
+
+# Threads used to read run summaries in list_runs
+LIST_RUNS_WORKERS = 16
+
+# Artifacts above this size are redacted directly rather than memoized
+REDACT_CACHE_MAX_LEN = 1_000_000
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_redact(content: str) -> str:
+    return redact_secrets(content)[0]
+
+
+def _redact(content: str) -> str:
+    """Redact secrets, reusing the result when the same content is rewritten."""
+    if len(content) > REDACT_CACHE_MAX_LEN:
+        return redact_secrets(content)[0]
+    return _cached_redact(content)
+
 
 class ArtifactManager:
     """Manages artifacts for a pipeline run."""
 
-    def __init__(self, artifacts_root: Path):
+    def __init__(self, artifacts_root: Path, trace_format: TraceFormat = "jsonl"):
+        if trace_format == "msgpack" and msgpack is None:
+            raise RuntimeError(
+                "trace_format='msgpack' requires msgpack (pip install 'ai-loop[fast]')"
+            )
         self.artifacts_root = artifacts_root
+        self.trace_format = trace_format
         self.artifacts_root.mkdir(parents=True, exist_ok=True)
+        # Directories already created by this manager (skips repeat mkdirs)
+        self._known_dirs: set[Path] = {artifacts_root}
+        # One append handle per trace file, kept open for the whole run
+        self._trace_handles: dict[Path, IO[bytes]] = {}
+        # Pending trace events, serialized and written in batches by the flusher
+        self._trace_queue: asyncio.Queue[tuple[Path, TraceEvent]] = asyncio.Queue()
+        # Entry the flusher has taken off the queue but not yet written; kept
+        # here so a drain from close_trace writes it ahead of later events
+        self._trace_head: tuple[Path, TraceEvent] | None = None
+        self._flusher: asyncio.Task | None = None
 
     def get_run_dir(self, run_id: str) -> Path:
         """Get the artifacts directory for a run."""
         run_dir = self.artifacts_root / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
+        if run_dir not in self._known_dirs:
+            run_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(run_dir)
         return run_dir
 
     def write_issue_pack(self, ctx: RunContext, content: str) -> Path:
         """Write the issue pack markdown."""
         path = ctx.artifacts_dir / "issue_pack.md"
-        safe_content, _ = redact_secrets(content)
-        path.write_text(safe_content)
+        path.write_text(_redact(content), encoding="utf-8")
         return path
 
     def write_plan(self, ctx: RunContext, version: int, content: str) -> Path:
         """Write a plan version."""
         path = ctx.artifacts_dir / f"plan_v{version}.md"
-        safe_content, _ = redact_secrets(content)
-        path.write_text(safe_content)
+        path.write_text(_redact(content), encoding="utf-8")
         return path
 
     def write_final_plan(self, ctx: RunContext, content: str) -> Path:
         """Write the final approved plan."""
         path = ctx.artifacts_dir / "final_plan.md"
-        safe_content, _ = redact_secrets(content)
-        path.write_text(safe_content)
+        path.write_text(_redact(content), encoding="utf-8")
         return path
 
     def write_implement_log(self, ctx: RunContext, content: str) -> Path:
         """Write implementation log."""
         path = ctx.artifacts_dir / "implement_log.txt"
-        safe_content, _ = redact_secrets(content)
-        path.write_text(safe_content)
+        path.write_text(_redact(content), encoding="utf-8")
         return path
 
     def write_fix_log(self, ctx: RunContext, iteration: int, content: str) -> Path:
         """Write code fix log."""
         path = ctx.artifacts_dir / f"implement_fix_v{iteration}.txt"
-        safe_content, _ = redact_secrets(content)
-        path.write_text(safe_content)
+        path.write_text(_redact(content), encoding="utf-8")
         return path
 
     def append_trace(self, ctx: RunContext, event: TraceEvent) -> None:
-        """Append an event to the trace log."""
-        path = ctx.artifacts_dir / "trace.jsonl"
-        with open(path, "a") as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
+        """Append an event to the trace log.
+
+        Queued for the background flusher when it is running (serialized
+        there, off the caller's path), otherwise written immediately.
+        """
+        path = ctx.artifacts_dir / TRACE_FILENAMES[self.trace_format]
+        if self._flusher is not None and not self._flusher.done():
+            self._trace_queue.put_nowait((path, event))
+        else:
+            self._write_trace_lines(path, [self._encode_event(event)])
+
+    def _encode_event(self, event: TraceEvent) -> bytes:
+        """Serialize one event as a trace record in this manager's format."""
+        if self.trace_format == "msgpack":
+            payload = msgpack.packb(event.to_dict())
+            return _FRAME_HEADER.pack(len(payload)) + payload
+        return fastjson.dumps(event.to_dict(), newline=True)
+
+    def _write_trace_lines(self, path: Path, lines: list[bytes]) -> None:
+        """Write trace lines to a run's trace file with a single write."""
+        fh = self._trace_handles.get(path)
+        if fh is None:
+            # Unbuffered: each batch is one write syscall and reaches disk
+            # immediately so the web dashboard can tail it, but without an
+            # open/close per event.
+            fh = self._trace_handles[path] = open(path, "ab", buffering=0)
+        fh.write(b"".join(lines))
+
+    def _drain_trace_queue(self, limit: int | None = None) -> None:
+        """Write queued trace events, grouped into one write per file."""
+        batches: dict[Path, list[bytes]] = {}
+        if self._trace_head is not None:
+            path, event = self._trace_head
+            self._trace_head = None
+            batches[path] = [self._encode_event(event)]
+        count = 0
+        while limit is None or count < limit:
+            try:
+                path, event = self._trace_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            batches.setdefault(path, []).append(self._encode_event(event))
+            count += 1
+
+        for path, lines in batches.items():
+            self._write_trace_lines(path, lines)
+
+    async def _flush_trace_loop(self) -> None:
+        """Background task: batch queued trace lines into grouped writes."""
+        try:
+            while True:
+                # Block (no wakeups) until there is something to write
+                self._trace_head = await self._trace_queue.get()
+                await asyncio.sleep(TRACE_FLUSH_INTERVAL)
+                self._drain_trace_queue(limit=TRACE_FLUSH_BATCH)
+        finally:
+            self._drain_trace_queue()
+
+    def start_flusher(self) -> None:
+        """Start batching trace writes on the running event loop (idempotent)."""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_trace_loop())
+
+    async def stop_flusher(self) -> None:
+        """Stop the flusher, writing any queued trace lines and closing handles."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        self.close()
+
+    def close_trace(self, ctx: RunContext) -> None:
+        """Flush and close the trace handle for a run (reopened on next event)."""
+        self._drain_trace_queue()
+        fh = self._trace_handles.pop(
+            ctx.artifacts_dir / TRACE_FILENAMES[self.trace_format], None
+        )
+        if fh is not None:
+            fh.close()
+
+    def close(self) -> None:
+        """Flush queued events and close all open trace handles."""
+        self._drain_trace_queue()
+        for fh in self._trace_handles.values():
+            fh.close()
+        self._trace_handles.clear()
 
     def write_summary(self, ctx: RunContext) -> Path:
         """Write the run summary."""
@@ -90,7 +226,7 @@ class ArtifactManager:
         )
 
         path = ctx.artifacts_dir / "summary.json"
-        path.write_text(json.dumps(summary.to_dict(), indent=2))
+        path.write_bytes(fastjson.dumps(summary, indent=True))
         return path
 
     def log_event(
@@ -103,73 +239,103 @@ class ArtifactManager:
         event = TraceEvent(
             timestamp=datetime.now(),
             event_type=event_type,
-            stage=ctx.status.value,
+            stage=ctx.status,
             data=data or {},
         )
         self.append_trace(ctx, event)
 
+    @staticmethod
+    def _parse_summary(summary_path: Path) -> RunSummary | None:
+        """Parse a run's summary.json, or None if missing or malformed."""
+        try:
+            data = fastjson.loads(summary_path.read_bytes())
+            return RunSummary(
+                run_id=data["run_id"],
+                issue_identifier=data["issue_identifier"],
+                issue_title=data["issue_title"],
+                status=RunStatus(data["status"]),
+                iterations=data["iterations"],
+                final_confidence=data.get("final_confidence"),
+                branch_name=data["branch_name"],
+                started_at=(
+                    datetime.fromisoformat(data["started_at"])
+                    if data.get("started_at")
+                    else None
+                ),
+                completed_at=(
+                    datetime.fromisoformat(data["completed_at"])
+                    if data.get("completed_at")
+                    else None
+                ),
+                error_message=data.get("error_message", ""),
+            )
+        except (OSError, fastjson.JSONDecodeError, KeyError, ValueError):
+            return None
+
     def list_runs(self) -> list[RunSummary]:
-        """List all runs with their summaries."""
-        runs: list[RunSummary] = []
+        """List all runs with their summaries, newest first."""
+        summary_paths = [
+            run_dir / "summary.json"
+            for run_dir in sorted(self.artifacts_root.iterdir(), reverse=True)
+            if run_dir.is_dir()
+        ]
+        if not summary_paths:
+            return []
 
-        for run_dir in sorted(self.artifacts_root.iterdir(), reverse=True):
-            if not run_dir.is_dir():
-                continue
+        # Reads are latency-bound; overlap them (map preserves order)
+        with ThreadPoolExecutor(max_workers=min(LIST_RUNS_WORKERS, len(summary_paths))) as ex:
+            results = list(ex.map(self._parse_summary, summary_paths))
 
-            summary_path = run_dir / "summary.json"
-            if not summary_path.exists():
-                continue
+        return [run for run in results if run is not None]
 
-            try:
-                data = json.loads(summary_path.read_text())
-                runs.append(
-                    RunSummary(
-                        run_id=data["run_id"],
-                        issue_identifier=data["issue_identifier"],
-                        issue_title=data["issue_title"],
-                        status=RunStatus(data["status"]),
-                        iterations=data["iterations"],
-                        final_confidence=data.get("final_confidence"),
-                        branch_name=data["branch_name"],
-                        started_at=(
-                            datetime.fromisoformat(data["started_at"])
-                            if data.get("started_at")
-                            else None
-                        ),
-                        completed_at=(
-                            datetime.fromisoformat(data["completed_at"])
-                            if data.get("completed_at")
-                            else None
-                        ),
-                        error_message=data.get("error_message", ""),
-                    )
-                )
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue
-
-        return runs
+    def iter_trace(self, run_id: str) -> Iterator[TraceEvent]:
+        """Stream trace events for a run, one event at a time.
 
-    def read_trace(self, run_id: str) -> list[TraceEvent]:
-        """Read trace events for a run."""
-        path = self.artifacts_root / run_id / "trace.jsonl"
+        Reads whichever trace format the run was written in.
+        """
+        run_dir = self.artifacts_root / run_id
+        msgpack_path = run_dir / TRACE_FILENAMES["msgpack"]
+        if msgpack_path.exists():
+            yield from self._iter_msgpack_trace(msgpack_path)
+            return
+
+        path = run_dir / TRACE_FILENAMES["jsonl"]
         if not path.exists():
-            return []
+            return
 
-        events: list[TraceEvent] = []
-        for line in path.read_text().splitlines():
-            if not line.strip():
-                continue
-            try:
-                data = json.loads(line)
-                events.append(
-                    TraceEvent(
-                        timestamp=datetime.fromisoformat(data["timestamp"]),
-                        event_type=data["event_type"],
-                        stage=data["stage"],
-                        data=data.get("data", {}),
-                    )
-                )
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue
-
-        return events
+        with open(path, "rb", buffering=1 << 20) as f:
+            # Every well-formed event starts with "{", so blank or garbled
+            # lines are dropped with a byte check instead of a raised error
+            for line in f:
+                if not line.startswith(b"{"):
+                    continue
+                try:
+                    event = TraceEvent.from_dict(fastjson.loads(line))
+                except (fastjson.JSONDecodeError, KeyError, ValueError):
+                    continue
+                yield event
+
+    @staticmethod
+    def _iter_msgpack_trace(path: Path) -> Iterator[TraceEvent]:
+        """Stream events from a length-prefixed msgpack trace."""
+        if msgpack is None:
+            raise RuntimeError(f"Reading {path} requires msgpack (pip install 'ai-loop[fast]')")
+
+        with open(path, "rb", buffering=1 << 20) as f:
+            while True:
+                header = f.read(_FRAME_HEADER.size)
+                if len(header) < _FRAME_HEADER.size:
+                    return
+                (size,) = _FRAME_HEADER.unpack(header)
+                payload = f.read(size)
+                if len(payload) < size:
+                    return  # Frame still being written
+                try:
+                    event = TraceEvent.from_dict(msgpack.unpackb(payload))
+                except (ValueError, KeyError, TypeError):
+                    continue
+                yield event
+
+    def read_trace(self, run_id: str) -> list[TraceEvent]:
+        """Read trace events for a run."""
+        return list(self.iter_trace(run_id))
@@ -0,0 +1,46 @@
+"""Shared Rich console for terminal output."""
+
+from __future__ import annotations
+
+import functools
+import sys
+from typing import TYPE_CHECKING, Any
+
+from ai_loop.core.logging import flush_logs
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class _StdoutAfterLogs:
+    """stdout for the console that writes pending log lines (stderr) first.
+
+    Log lines go out on a background thread, so without this a line logged
+    before a ``console.print`` could reach the terminal after it.
+    """
+
+    @staticmethod
+    def _stdout() -> Any:
+        # Looked up per write (tests and Live swap sys.stdout); a Live
+        # redirect proxies back into the console, so write to what it wraps
+        return getattr(sys.stdout, "rich_proxied_file", sys.stdout)
+
+    def write(self, text: str) -> int:
+        flush_logs()
+        return self._stdout().write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stdout(), name)
+
+
+@functools.cache
+def get_console() -> Console:
+    """Get the process-wide Console, created on first use.
+
+    Sharing one instance means terminal capabilities are probed once and all
+    dashboard/CLI output serializes through a single render lock, written
+    after any log lines queued before it.
+    """
+    from rich.console import Console
+
+    return Console(file=_StdoutAfterLogs())
@@ -3,20 +3,53 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from rich.console import Console
 from rich.live import Live
-from rich.table import Table
+from rich.table import Column, Table
 from rich.text import Text
 
+from ai_loop.core.console import get_console
+
 if TYPE_CHECKING:
     from ai_loop.core.models import RunContext, RunStatus
 
-
-@dataclass
+# Minimum seconds between batch dashboard rebuilds (matches Live's 4 fps)
+RENDER_INTERVAL = 0.25
+
+# Batch table columns, built once and copied per frame
+_BATCH_COLUMNS = (
+    Column("Issue", style="dim", width=10, no_wrap=True),
+    Column("Title", width=35, no_wrap=True, overflow="ellipsis"),
+    Column("Stage", width=12, no_wrap=True),
+    Column("Iter", justify="center", width=4, no_wrap=True),
+    Column("Conf", justify="center", width=4, no_wrap=True),
+    Column("Blk", justify="center", width=3, no_wrap=True),
+    Column("Time", justify="center", width=6, no_wrap=True),
+    Column("Last Event", width=25, no_wrap=True, overflow="ellipsis"),
+)
+
+# Characters of an issue's last event kept for display
+LAST_EVENT_MAX_LEN = 30
+
+# Batch table cell styles (statuses not listed render cyan)
+_STATUS_STYLES = {
+    "success": "bold green",
+    "failed": "bold red",
+    "stuck": "bold yellow",
+    "pending": "dim",
+}
+
+# Confidence cell color, indexed by confidence 0-100
+_CONFIDENCE_COLORS = tuple(
+    "green" if c >= 97 else "yellow" if c >= 80 else "red" for c in range(101)
+)
+
+
+@dataclass(slots=True)
 class IssueProgress:
     """Progress tracker for a single issue."""
 
@@ -27,28 +60,43 @@ class IssueProgress:
     confidence: int | None = None
     blockers: int = 0
     started_at: datetime | None = None
+    # time.monotonic() at start, used for elapsed time
+    started_monotonic: float | None = None
     last_event: str = ""
     error: str = ""
+    # (whole seconds, formatted string) from the last elapsed() call
+    _elapsed_cache: tuple[int, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def elapsed(self) -> str:
-        """Get elapsed time string."""
-        if not self.started_at:
+    def elapsed(self, now: float | None = None) -> str:
+        """Get elapsed time string (reused while the whole seconds are unchanged).
+
+        ``now`` is a ``time.monotonic()`` reading, taken fresh if omitted.
+        """
+        if self.started_monotonic is None:
             return "-"
-        delta = datetime.now() - self.started_at
-        total_seconds = int(delta.total_seconds())
+        total_seconds = int((now if now is not None else time.monotonic()) - self.started_monotonic)
+        if self._elapsed_cache is not None and self._elapsed_cache[0] == total_seconds:
+            return self._elapsed_cache[1]
         minutes, seconds = divmod(total_seconds, 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        text = f"{minutes:02d}:{seconds:02d}"
+        self._elapsed_cache = (total_seconds, text)
+        return text
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchProgress:
     """Progress tracker for a batch run."""
 
     issues: dict[str, IssueProgress] = field(default_factory=dict)
     started_at: datetime = field(default_factory=datetime.now)
+    started_monotonic: float = field(default_factory=time.monotonic)
     completed: int = 0
     failed: int = 0
     total: int = 0
+    # Bumped whenever total/completed/failed change (invalidates the summary row)
+    summary_version: int = field(default=0, init=False, repr=False, compare=False)
 
     def add_issue(self, identifier: str, title: str) -> None:
         """Add an issue to track."""
@@ -57,6 +105,7 @@ class BatchProgress:
             issue_title=title[:40] + "..." if len(title) > 40 else title,
         )
         self.total += 1
+        self.summary_version += 1
 
     def update(
         self,
@@ -68,40 +117,55 @@ class BatchProgress:
         blockers: int | None = None,
         last_event: str | None = None,
         error: str | None = None,
-    ) -> None:
-        """Update progress for an issue."""
-        if identifier not in self.issues:
-            return
+    ) -> bool:
+        """Update progress for an issue. Returns whether anything changed."""
+        progress = self.issues.get(identifier)
+        if progress is None:
+            return False
 
-        progress = self.issues[identifier]
+        changed = False
 
-        if status is not None:
+        if status is not None and status != progress.status:
             progress.status = status
+            changed = True
             if status == "success":
                 self.completed += 1
+                self.summary_version += 1
             elif status == "failed":
                 self.failed += 1
+                self.summary_version += 1
 
-        if iteration is not None:
+        if iteration is not None and iteration != progress.iteration:
             progress.iteration = iteration
+            changed = True
 
-        if confidence is not None:
+        if confidence is not None and confidence != progress.confidence:
             progress.confidence = confidence
+            changed = True
 
-        if blockers is not None:
+        if blockers is not None and blockers != progress.blockers:
             progress.blockers = blockers
+            changed = True
 
         if last_event is not None:
-            progress.last_event = last_event
+            last_event = last_event[:LAST_EVENT_MAX_LEN]
+            if last_event != progress.last_event:
+                progress.last_event = last_event
+                changed = True
 
-        if error is not None:
+        if error is not None and error != progress.error:
             progress.error = error
+            changed = True
 
         if progress.started_at is None and status not in ("pending", None):
             progress.started_at = datetime.now()
+            progress.started_monotonic = time.monotonic()
+            changed = True
 
-    def from_context(self, ctx: "RunContext") -> None:
-        """Update from a RunContext."""
+        return changed
+
+    def from_context(self, ctx: "RunContext") -> bool:
+        """Update from a RunContext. Returns whether anything changed."""
         confidence = None
         blockers = 0
         if ctx.plan_gates:
@@ -111,9 +175,9 @@ class BatchProgress:
             confidence = ctx.code_gates[-1].confidence
             blockers = len(ctx.code_gates[-1].blockers)
 
-        self.update(
+        return self.update(
             ctx.issue.identifier,
-            status=ctx.status.value,
+            status=ctx.status,
             iteration=ctx.current_iteration,
             confidence=confidence,
             blockers=blockers,
@@ -124,30 +188,87 @@ class BatchProgress:
 class Dashboard:
     """Live terminal dashboard for batch runs."""
 
+    # Index of the elapsed-time column, the only cell that changes without an update
+    _TIME_COLUMN = 6
+
     def __init__(self):
-        self.console = Console()
+        self.console = get_console()
         self.progress = BatchProgress()
         self._live: Live | None = None
         self._update_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._finished = False
+        self._tick_handle: asyncio.TimerHandle | None = None
+        # Last rendered cells per issue; only rows marked dirty are rebuilt
+        self._cells: dict[str, list[str | Text]] = {}
+        self._dirty: set[str] = set()
+        self._summary_version = -1
+        self._summary_cells: list[str] = []
+
+    async def __aenter__(self) -> "Dashboard":
+        """Start rendering in a background task."""
+        self._task = asyncio.create_task(self.run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Wait for the final frame after a clean exit, otherwise cancel."""
+        task, self._task = self._task, None
+        try:
+            if exc_type is None and task is not None:
+                self.finish()
+                await task
+        finally:
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+            self.stop()
 
     def add_issues(self, issues: list[tuple[str, str]]) -> None:
         """Add issues to track. Each tuple is (identifier, title)."""
         for identifier, title in issues:
             self.progress.add_issue(identifier, title)
+            self._dirty.add(identifier)
 
     def update(self, identifier: str, **kwargs) -> None:
         """Update progress for an issue."""
-        self.progress.update(identifier, **kwargs)
-        self._update_event.set()
+        if self.progress.update(identifier, **kwargs):
+            self._dirty.add(identifier)
+            self._update_event.set()
 
     def update_from_context(self, ctx: "RunContext") -> None:
         """Update from a RunContext."""
-        self.progress.from_context(ctx)
-        self._update_event.set()
+        if self.progress.from_context(ctx):
+            self._dirty.add(ctx.issue.identifier)
+            self._update_event.set()
+
+    @staticmethod
+    def _render_row(progress: IssueProgress) -> list[str | Text]:
+        """Build the table cells for one issue."""
+        status_text = Text(progress.status, style=_STATUS_STYLES.get(progress.status, "cyan"))
+
+        conf_text = "-"
+        if progress.confidence is not None:
+            color = _CONFIDENCE_COLORS[min(max(progress.confidence, 0), 100)]
+            conf_text = f"[{color}]{progress.confidence}[/{color}]"
+
+        blockers_text = f"[red]{progress.blockers}[/red]" if progress.blockers > 0 else "-"
+
+        return [
+            progress.issue_identifier,
+            progress.issue_title,
+            status_text,
+            str(progress.iteration) if progress.iteration else "-",
+            conf_text,
+            blockers_text,
+            "",  # Elapsed time, filled in per render
+            progress.last_event or "-",
+        ]
 
     def _build_table(self) -> Table:
-        """Build the progress table."""
+        """Build the progress table, re-rendering only rows updated since the last call."""
+        # Column.copy() gives each frame empty cell lists on the shared specs
         table = Table(
+            *(column.copy() for column in _BATCH_COLUMNS),
             title="AI Loop Batch Progress",
             title_style="bold cyan",
             show_header=True,
@@ -156,71 +277,31 @@ class Dashboard:
             min_width=120,  # Fixed minimum width for stability
         )
 
-        table.add_column("Issue", style="dim", width=10, no_wrap=True)
-        table.add_column("Title", width=35, no_wrap=True, overflow="ellipsis")
-        table.add_column("Stage", width=12, no_wrap=True)
-        table.add_column("Iter", justify="center", width=4, no_wrap=True)
-        table.add_column("Conf", justify="center", width=4, no_wrap=True)
-        table.add_column("Blk", justify="center", width=3, no_wrap=True)
-        table.add_column("Time", justify="center", width=6, no_wrap=True)
-        table.add_column("Last Event", width=25, no_wrap=True, overflow="ellipsis")
-
-        for progress in self.progress.issues.values():
-            # Status styling
-            status_text = Text(progress.status)
-            if progress.status == "success":
-                status_text.stylize("bold green")
-            elif progress.status == "failed":
-                status_text.stylize("bold red")
-            elif progress.status == "stuck":
-                status_text.stylize("bold yellow")
-            elif progress.status == "pending":
-                status_text.stylize("dim")
-            else:
-                status_text.stylize("cyan")
-
-            # Confidence styling
-            conf_text = "-"
-            if progress.confidence is not None:
-                conf_text = str(progress.confidence)
-                if progress.confidence >= 97:
-                    conf_text = f"[green]{conf_text}[/green]"
-                elif progress.confidence >= 80:
-                    conf_text = f"[yellow]{conf_text}[/yellow]"
-                else:
-                    conf_text = f"[red]{conf_text}[/red]"
-
-            # Blockers styling
-            blockers_text = str(progress.blockers) if progress.blockers else "-"
-            if progress.blockers > 0:
-                blockers_text = f"[red]{blockers_text}[/red]"
-
-            table.add_row(
-                progress.issue_identifier,
-                progress.issue_title,
-                status_text,
-                str(progress.iteration) if progress.iteration else "-",
-                conf_text,
-                blockers_text,
-                progress.elapsed(),
-                progress.last_event[:30] if progress.last_event else "-",
-            )
+        now = time.monotonic()
+        for identifier, progress in self.progress.issues.items():
+            row = self._cells.get(identifier)
+            if row is None or identifier in self._dirty:
+                row = self._cells[identifier] = self._render_row(progress)
+            row[self._TIME_COLUMN] = progress.elapsed(now)
+            table.add_row(*row)
+        self._dirty.clear()
 
         # Summary row
-        elapsed = datetime.now() - self.progress.started_at
-        elapsed_str = f"{int(elapsed.total_seconds())}s"
+        if self.progress.summary_version != self._summary_version:
+            self._summary_version = self.progress.summary_version
+            self._summary_cells = [
+                "",
+                f"[bold]Total: {self.progress.total}[/bold]",
+                f"[green]Done: {self.progress.completed}[/green] [red]Fail: {self.progress.failed}[/red]",
+                "",
+                "",
+                "",
+            ]
+
+        elapsed_str = f"{int(now - self.progress.started_monotonic)}s"
 
         table.add_section()
-        table.add_row(
-            "",
-            f"[bold]Total: {self.progress.total}[/bold]",
-            f"[green]Done: {self.progress.completed}[/green] [red]Fail: {self.progress.failed}[/red]",
-            "",
-            "",
-            "",
-            elapsed_str,
-            "",
-        )
+        table.add_row(*self._summary_cells, elapsed_str, "")
 
         return table
 
@@ -234,23 +315,46 @@ class Dashboard:
             transient=False,  # Keep final state visible
         ) as live:
             self._live = live
-            while True:
-                # Wait for update or timeout
-                try:
-                    await asyncio.wait_for(self._update_event.wait(), timeout=0.25)
-                    self._update_event.clear()
-                except asyncio.TimeoutError:
-                    pass
+            loop = asyncio.get_running_loop()
+            next_render = loop.time() + RENDER_INTERVAL
+            self._tick_handle = loop.call_later(1, self._tick)
+            try:
+                while True:
+                    # Sleep until an update or the once-a-second elapsed tick
+                    await self._update_event.wait()
+
+                    # Final frame goes out immediately; otherwise hold off until
+                    # the frame deadline so a burst of updates collapses into
+                    # a single rebuild
+                    done = self._finished or (
+                        self.progress.completed + self.progress.failed
+                        >= self.progress.total
+                    )
+                    delay = next_render - loop.time()
+                    if delay > 0 and not done:
+                        await asyncio.sleep(delay)
 
-                live.update(self._build_table())
+                    self._update_event.clear()
+                    live.update(self._build_table())
+                    next_render = loop.time() + RENDER_INTERVAL
+
+                    # Live is non-transient, so the final frame stays on screen
+                    if done:
+                        break
+            finally:
+                if self._tick_handle:
+                    self._tick_handle.cancel()
+                    self._tick_handle = None
+
+    def finish(self) -> None:
+        """Render the final frame and end run(), even if some issues never finished."""
+        self._finished = True
+        self._update_event.set()
 
-                # Check if all done
-                if (
-                    self.progress.completed + self.progress.failed
-                    >= self.progress.total
-                ):
-                    await asyncio.sleep(1)  # Show final state briefly
-                    break
+    def _tick(self) -> None:
+        """Wake the render loop to refresh elapsed times, then reschedule."""
+        self._update_event.set()
+        self._tick_handle = asyncio.get_running_loop().call_later(1, self._tick)
 
     def stop(self) -> None:
         """Stop the dashboard."""
@@ -278,31 +382,39 @@ class SimpleDashboard:
     }
 
     def __init__(self, issue_id: str | None = None, batch_mode: bool = False):
-        self.console = Console()
+        self.console = get_console()
         self.issue_id = issue_id
         self.batch_mode = batch_mode
+        # Stage prefixes by stage (issue_id and batch_mode are fixed per dashboard)
+        self._prefix_cache: dict[str, str] = {}
         self._status_context = None
-        self._stage_start: datetime | None = None
+        self._stage_start: float | None = None  # time.monotonic()
+        # Once-a-second elapsed-time refresh, only scheduled while a stage runs
+        self._tick_handle: asyncio.TimerHandle | None = None
 
     def _format_elapsed(self) -> str:
         """Format elapsed time since stage start."""
-        if not self._stage_start:
+        if self._stage_start is None:
             return "0:00"
-        delta = datetime.now() - self._stage_start
-        total_seconds = int(delta.total_seconds())
+        total_seconds = int(time.monotonic() - self._stage_start)
         minutes, seconds = divmod(total_seconds, 60)
         return f"{minutes}:{seconds:02d}"
 
     def _stage_prefix(self, stage: str) -> str:
         """Build stage prefix with optional issue ID for batch mode."""
-        label = self.STAGE_LABELS.get(stage, stage.upper())
-        if self.batch_mode and self.issue_id:
-            return f"[{self.issue_id}][{label}]"
-        return f"[{label}]"
+        prefix = self._prefix_cache.get(stage)
+        if prefix is None:
+            label = self.STAGE_LABELS.get(stage, stage.upper())
+            if self.batch_mode and self.issue_id:
+                prefix = f"[{self.issue_id}][{label}]"
+            else:
+                prefix = f"[{label}]"
+            self._prefix_cache[stage] = prefix
+        return prefix
 
     def start_stage(self, stage: str, description: str) -> None:
         """Start a stage with spinner display."""
-        self._stage_start = datetime.now()
+        self._stage_start = time.monotonic()
         prefix = self._stage_prefix(stage)
         self._status_context = self.console.status(
             f"{prefix} {description}... ({self._format_elapsed()})",
@@ -311,6 +423,25 @@ class SimpleDashboard:
         self._status_context.start()
         self._current_stage = stage
         self._current_description = description
+        self._schedule_tick()
+
+    def _schedule_tick(self) -> None:
+        """Schedule the next elapsed-time refresh on the running loop, if any."""
+        if self._tick_handle:
+            self._tick_handle.cancel()
+            self._tick_handle = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No event loop (sync use): spinner just won't tick
+        self._tick_handle = loop.call_later(1, self._tick)
+
+    def _tick(self) -> None:
+        """Refresh elapsed time and reschedule while a stage is active."""
+        self._tick_handle = None
+        if self._status_context:
+            self.update_stage()
+            self._schedule_tick()
 
     def update_stage(self, extra: str = "") -> None:
         """Update the spinner with current elapsed time."""
@@ -323,6 +454,9 @@ class SimpleDashboard:
 
     def stop_stage(self) -> None:
         """Stop the current stage spinner."""
+        if self._tick_handle:
+            self._tick_handle.cancel()
+            self._tick_handle = None
         if self._status_context:
             self._status_context.stop()
             self._status_context = None
@@ -339,6 +473,14 @@ class SimpleDashboard:
         if self._status_context:
             self._status_context.start()
 
+    def _print_plain(self, text: str, style: str = "") -> None:
+        """Print text as-is: no markup parsing or auto-highlighting.
+
+        Event data (blockers, errors, dict reprs) may contain square brackets
+        that Rich would otherwise treat as markup.
+        """
+        self.console.print(text, style=style, markup=False, highlight=False)
+
     def key_event(self, event_type: str, data: dict) -> None:
         """Print a key event (always shown, not just verbose)."""
         # Stop spinner briefly to print
@@ -351,7 +493,7 @@ class SimpleDashboard:
             approved = data.get("approved", False)
             result = "approved" if approved else "rejected"
             blocker_str = f"{blockers} blockers | " if blockers else ""
-            self.console.print(f"  → Confidence: {conf} | {blocker_str}{result}")
+            self._print_plain(f"  → Confidence: {conf} | {blocker_str}{result}")
 
         elif event_type == "code_gate_result":
             conf = data.get("confidence", "?")
@@ -359,35 +501,35 @@ class SimpleDashboard:
             approved = data.get("approved", False)
             result = "approved" if approved else "rejected"
             blocker_str = f"{blockers} blockers | " if blockers else ""
-            self.console.print(f"  → Confidence: {conf} | {blocker_str}{result}")
+            self._print_plain(f"  → Confidence: {conf} | {blocker_str}{result}")
 
         elif event_type == "plan_approved":
             iterations = data.get("iterations", "?")
-            self.console.print(
+            self._print_plain(
                 f"  → Plan approved ({iterations} iterations)",
                 style="green",
             )
 
         elif event_type == "plan_gate_passed":
             stable = data.get("stable_count", "?")
-            self.console.print(f"  → Gate passed (stable: {stable})")
+            self._print_plain(f"  → Gate passed (stable: {stable})")
 
         elif event_type == "plan_gate_failed":
             blockers = data.get("blockers", [])
             if blockers:
-                self.console.print(f"  → Gate failed: {blockers[0][:60]}...", style="yellow")
+                self._print_plain(f"  → Gate failed: {blockers[0][:60]}...", style="yellow")
 
         elif event_type == "code_gate_passed":
-            self.console.print("  → Code approved", style="green")
+            self._print_plain("  → Code approved", style="green")
 
         elif event_type == "code_gate_failed":
             blockers = data.get("blockers", [])
             if blockers:
-                self.console.print(f"  → Review failed: {blockers[0][:60]}...", style="yellow")
+                self._print_plain(f"  → Review failed: {blockers[0][:60]}...", style="yellow")
 
         elif event_type == "pipeline_error":
             error = data.get("error", "Unknown error")
-            self.console.print(f"  → Error: {error}", style="red")
+            self._print_plain(f"  → Error: {error}", style="red")
 
         # Restart spinner if it was running
         if self._status_context:
@@ -409,7 +551,7 @@ class SimpleDashboard:
 
     def event(self, event_type: str, data: dict) -> None:
         """Print an event (verbose mode only, dim style)."""
-        self.console.print(f"  [dim]{event_type}: {data}[/dim]")
+        self._print_plain(f"  {event_type}: {data}", style="dim")
 
     def show_failure(
         self,
@@ -419,24 +561,35 @@ class SimpleDashboard:
         artifacts_path: str,
     ) -> None:
         """Show formatted failure output per UX contract."""
-        self.console.print()
-        self.console.print(f"[bold red]✗ Pipeline failed at {stage.upper()}[/bold red]")
-        self.console.print()
-        if exit_code is not None:
-            self.console.print(f"  Exit code: {exit_code}")
-        self.console.print(f"  Error: {error_msg}")
-        self.console.print()
-        self.console.print(f"  Artifacts: {artifacts_path}")
-        self.console.print(f"  Logs: {artifacts_path}/trace.jsonl")
-        self.console.print()
-        self.console.print("  Next: re-run with --verbose and inspect trace.jsonl")
+        exit_line = f"  Exit code: {exit_code}\n" if exit_code is not None else ""
+        # One write (no interleaving); plain text so error messages can't inject markup
+        self.console.print(
+            Text.assemble(
+                "\n",
+                (f"✗ Pipeline failed at {stage.upper()}", "bold red"),
+                "\n\n",
+                exit_line,
+                f"  Error: {error_msg}\n",
+                "\n",
+                f"  Artifacts: {artifacts_path}\n",
+                f"  Logs: {artifacts_path}/trace.jsonl\n",
+                "\n",
+                "  Next: re-run with --verbose and inspect trace.jsonl",
+            ),
+            highlight=False,
+        )
 
     def show_interrupt(self, artifacts_path: str, branch_name: str) -> None:
         """Show formatted interrupt output per UX contract."""
-        self.console.print()
-        self.console.print("[bold yellow]⚠ Interrupted by user[/bold yellow]")
-        self.console.print()
-        self.console.print(f"  Partial artifacts saved to: {artifacts_path}")
-        self.console.print(f"  Branch preserved: {branch_name}")
-        self.console.print()
-        self.console.print("  Resume: ai-loop run --issue ISSUE-ID --continue-from run-id")
+        self.console.print(
+            Text.assemble(
+                "\n",
+                ("⚠ Interrupted by user", "bold yellow"),
+                "\n\n",
+                f"  Partial artifacts saved to: {artifacts_path}\n",
+                f"  Branch preserved: {branch_name}\n",
+                "\n",
+                "  Resume: ai-loop run --issue ISSUE-ID --continue-from run-id",
+            ),
+            highlight=False,
+        )
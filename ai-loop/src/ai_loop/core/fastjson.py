@@ -0,0 +1,50 @@
+"""JSON encode/decode using orjson when installed, stdlib json otherwise.
+
+Both paths produce and accept the same documents; orjson is just faster and
+works in bytes directly. Decode errors are ``json.JSONDecodeError`` either way
+(orjson's error type subclasses it).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _to_dict(obj: Any) -> Any:
+    """Stdlib fallback for objects orjson encodes natively (dataclasses)."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def dumps(obj: Any, *, indent: bool = False, newline: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (2-space indent / trailing newline if requested).
+
+    Dataclasses are encoded natively by orjson; the stdlib fallback calls
+    their ``to_dict()``, which must produce the same document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    text = json.dumps(obj, indent=2 if indent else None, default=_to_dict)
+    return (text + "\n" if newline else text).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
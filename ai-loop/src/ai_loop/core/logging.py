@@ -1,7 +1,11 @@
 """Single logging path for AI Loop. Replaces all ad-hoc print() calls."""
 
+import atexit
+import queue
+import re
 import sys
-from datetime import datetime
+import threading
+import time
 
 # High-signal prefixes shown in terminal (all emitted prefixes)
 HIGH_SIGNAL = {
@@ -18,20 +22,101 @@ HIGH_SIGNAL = {
     "ERROR",
 }
 
+# Error indicators always shown, regardless of prefix
+ERROR_MARKERS = ("ERROR", "Traceback", "Exception", "FAILED")
+
+# One pass over the line for every marker and "[PREFIX]" tag
+_HIGH_SIGNAL_RE = re.compile(
+    "|".join(
+        [re.escape(marker) for marker in ERROR_MARKERS]
+        + [re.escape(f"[{prefix}]") for prefix in sorted(HIGH_SIGNAL)]
+    )
+)
+
+
+# (epoch second, "HH:MM:SS") for the most recent log() call
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+# Formatted lines (or flush markers) waiting for the writer thread
+_log_queue: queue.SimpleQueue[str | threading.Event] = queue.SimpleQueue()
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
+def _drain_log_queue() -> None:
+    """Writer thread: write queued lines to stderr in batches, one flush each."""
+    while True:
+        batch = [_log_queue.get()]
+        while True:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        lines = [item for item in batch if isinstance(item, str)]
+        if lines:
+            try:
+                sys.stderr.write("".join(lines))
+                sys.stderr.flush()
+            except (OSError, ValueError):
+                pass  # stderr closed or broken; nothing useful to do
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()
+
+
+def _ensure_writer() -> None:
+    """Start the stderr writer thread on first use."""
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_drain_log_queue, name="ai-loop-log", daemon=True)
+            _writer.start()
+            atexit.register(flush_logs)
+
+
+def flush_logs(timeout: float = 1.0) -> None:
+    """Block until every line logged so far has been written to stderr."""
+    if _writer is None:
+        return
+    done = threading.Event()
+    _log_queue.put(done)
+    done.wait(timeout)
+
+
+def _timestamp() -> str:
+    """Current "HH:MM:SS", reformatted at most once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        # Racing threads write the same value
+        _timestamp_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _timestamp_cache[1]
+
 
 def log(prefix: str, message: str) -> None:
-    """Log with timestamp. Always to stderr (won't interfere with stdout capture)."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] [{prefix}] {message}", file=sys.stderr, flush=True)
+    """Log with timestamp. Always to stderr (won't interfere with stdout capture).
+
+    Lines are handed to a background writer thread; call ``flush_logs()``
+    where they must be visible before continuing (done automatically at exit).
+    """
+    _ensure_writer()
+    _log_queue.put(f"[{_timestamp()}] [{prefix}] {message}\n")
+
+
+def log_lines(prefix: str, messages: list[str]) -> None:
+    """Log several related lines as one block.
+
+    The block is queued and written together, so concurrent pipelines in a
+    batch can't interleave their lines into it.
+    """
+    _ensure_writer()
+    head = f"[{_timestamp()}] [{prefix}] "
+    _log_queue.put("".join(f"{head}{message}\n" for message in messages))
 
 
 def is_high_signal(line: str) -> bool:
     """Check if a log line should be shown in terminal."""
-    # Error indicators always shown
-    if any(err in line for err in ("ERROR", "Traceback", "Exception", "FAILED")):
-        return True
-    # Check for high-signal prefixes
-    for prefix in HIGH_SIGNAL:
-        if f"[{prefix}]" in line:
-            return True
-    return False
+    return _HIGH_SIGNAL_RE.search(line) is not None
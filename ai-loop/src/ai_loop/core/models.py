@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - exercised only without the extra
+    xxhash = None  # type: ignore[assignment]
 
-class RunStatus(str, Enum):
-    """Status of a pipeline run."""
+
+def _content_hash(content: str) -> str:
+    """16-hex-char fingerprint for change detection (not security)."""
+    data = content.encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+class RunStatus(StrEnum):
+    """Status of a pipeline run.
+
+    Members are their own string values (also under str() and f-strings), so
+    they can be logged and serialized without ``.value``.
+    """
 
     PENDING = "pending"
     PLANNING = "planning"
@@ -42,9 +62,9 @@ class ApprovalMode(str, Enum):
     ALWAYS_GATE = "always_gate"  # Blocks at every gate for human decision
 
 
-@dataclass
+@dataclass(frozen=True)
 class LinearIssue:
-    """Represents a Linear issue."""
+    """Represents a Linear issue (immutable, so the issue pack can be cached)."""
 
     id: str
     identifier: str
@@ -59,8 +79,9 @@ class LinearIssue:
     labels: list[str] = field(default_factory=list)
     url: str = ""
 
-    def to_issue_pack(self) -> str:
-        """Convert to issue pack markdown format."""
+    @functools.cached_property
+    def issue_pack(self) -> str:
+        """Issue pack markdown, built on first access."""
         lines = [
             f"# Issue: {self.identifier}",
             "",
@@ -78,6 +99,10 @@ class LinearIssue:
         lines.extend(["", "## Description", "", self.description or "_No description_"])
         return "\n".join(lines)
 
+    def to_issue_pack(self) -> str:
+        """Convert to issue pack markdown format."""
+        return self.issue_pack
+
 
 class DiffInstruction(BaseModel):
     """Structured diff instruction from critique."""
@@ -126,7 +151,7 @@ class CritiqueResult(BaseModel):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanVersion:
     """A version of the implementation plan."""
 
@@ -136,14 +161,15 @@ class PlanVersion:
     hash: str = ""
 
     def __post_init__(self) -> None:
-        import hashlib
-
-        self.hash = hashlib.sha256(self.content.encode()).hexdigest()[:16]
+        self.hash = _content_hash(self.content)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunContext:
-    """Context for a pipeline run."""
+    """Context for a pipeline run.
+
+    ``issue`` is the sanitized issue (see PipelineOrchestrator.create_context).
+    """
 
     run_id: str
     issue: LinearIssue
@@ -168,19 +194,37 @@ class RunContext:
     current_iteration: int = 0
     stable_pass_count: int = 0
     plan_versions: list[PlanVersion] = field(default_factory=list)
+    # Hashes of the last three plan versions, for stuck detection
+    recent_plan_hashes: deque[str] = field(default_factory=lambda: deque(maxlen=3))
     plan_gates: list[CritiqueResult] = field(default_factory=list)
     code_gates: list[CritiqueResult] = field(default_factory=list)
     final_plan: str = ""
+    # Merge-base CODE_GATE diffs are taken against; commits on the run's
+    # branch don't move it, so it is looked up once per run
+    diff_base: str | None = None
     error_message: str = ""
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
+    # Human gate handoff files, read and written by the web UI
+    gate_pending_path: Path = field(init=False, repr=False)
+    gate_resolution_path: Path = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.gate_pending_path = self.artifacts_dir / "gate_pending.json"
+        self.gate_resolution_path = self.artifacts_dir / "gate_resolution.json"
+
     def working_dir(self) -> Path:
         """Get the working directory for implementation."""
         return self.worktree_dir if self.worktree_dir else self.repo_root
 
+    def add_plan_version(self, plan: PlanVersion) -> None:
+        """Record a new plan version."""
+        self.plan_versions.append(plan)
+        self.recent_plan_hashes.append(plan.hash)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TraceEvent:
     """Event for the trace log."""
 
@@ -188,17 +232,31 @@ class TraceEvent:
     event_type: str
     stage: str
     data: dict[str, Any]
+    # Formatted once; events are serialized for the trace file and the web UI
+    timestamp_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "timestamp_iso", self.timestamp.isoformat())
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "event_type": self.event_type,
             "stage": self.stage,
             "data": self.data,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TraceEvent:
+        return cls(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            event_type=data["event_type"],
+            stage=data["stage"],
+            data=data.get("data", {}),
+        )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunSummary:
     """Summary of a completed run."""
 
@@ -215,11 +273,13 @@ class RunSummary:
     approval_mode: ApprovalMode = ApprovalMode.AUTO
 
     def to_dict(self) -> dict[str, Any]:
+        # Matches orjson's native dataclass encoding (see fastjson.dumps),
+        # which serializes summaries directly when it is installed
         return {
             "run_id": self.run_id,
             "issue_identifier": self.issue_identifier,
             "issue_title": self.issue_title,
-            "status": self.status.value,
+            "status": self.status,
             "iterations": self.iterations,
             "final_confidence": self.final_confidence,
             "branch_name": self.branch_name,
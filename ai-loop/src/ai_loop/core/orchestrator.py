@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import uuid
+import secrets
+import time
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
+from ai_loop.config import get_settings
+from ai_loop.core import fastjson
 from ai_loop.core.artifacts import ArtifactManager
 from ai_loop.core.logging import log as term_log
+from ai_loop.core.logging import log_lines as term_log_lines
 from ai_loop.core.models import (
     ApprovalMode,
     CritiqueResult,
@@ -20,18 +24,47 @@ from ai_loop.core.models import (
     RunContext,
     RunStatus,
 )
-from ai_loop.integrations.claude_runner import ClaudeRunner
-from ai_loop.integrations.git_tools import GitTools
-from ai_loop.integrations.openai_critique_runner import OpenAICritiqueRunner
-from ai_loop.integrations.linear import LinearClient
-from ai_loop.safety.sanitizer import sanitize_issue_content, sanitize_issue_title
+from ai_loop.integrations.git_tools import GitTools, WorktreePool
+from ai_loop.safety.sanitizer import (
+    safe_identifier,
+    sanitize_issue_content,
+    sanitize_issue_title,
+)
+
+try:
+    import watchfiles
+except ImportError:  # pragma: no cover - exercised only without the extra
+    watchfiles = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
-    pass
+    from ai_loop.integrations.claude_runner import ClaudeRunner
+    from ai_loop.integrations.linear import LinearClient
+    from ai_loop.integrations.openai_critique_runner import OpenAICritiqueRunner
 
 # Maximum fix iterations for CODE_GATE
 MAX_FIX_ITERATIONS = 3
 
+# Human gate resolution: auto-reject after this long. Without watchfiles the
+# resolution file is polled with exponential backoff (most decisions land
+# within seconds); with it, the poll is only a safety net in case a
+# filesystem event is missed.
+GATE_RESOLUTION_TIMEOUT = 30 * 60
+GATE_POLL_INTERVAL = 0.1
+GATE_POLL_BACKOFF = 1.6
+GATE_POLL_INTERVAL_MAX = 5
+GATE_WATCH_SAFETY_INTERVAL = 60
+
+
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """Run awaitables concurrently; if one fails, cancel the rest and re-raise."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class PipelineOrchestrator:
     """Orchestrates the full AI Loop pipeline."""
@@ -44,17 +77,70 @@ class PipelineOrchestrator:
         self.git = GitTools(repo_root)
         self.repo_root = self.git.get_repo_root()
         self.artifacts_root = artifacts_root or (self.repo_root / "artifacts")
-        self.artifacts = ArtifactManager(self.artifacts_root)
-        self.linear = LinearClient()
-        self.claude = ClaudeRunner()
-        self.critique = OpenAICritiqueRunner()
+        settings = get_settings()
+        self.artifacts = ArtifactManager(
+            self.artifacts_root, trace_format=settings.trace_format
+        )
+        self.worktree_pool = (
+            WorktreePool(
+                self.git, self.artifacts_root / ".worktrees", settings.worktree_pool_size
+            )
+            if settings.worktree_pool_size
+            else None
+        )
+        self.max_diff_chars = settings.critique_max_diff_chars
+        # Pipelines currently running (batch mode shares one orchestrator)
+        self._active_runs = 0
+        # API clients, created by the properties below
+        self._linear: LinearClient | None = None
+        self._claude: ClaudeRunner | None = None
+        self._critique: OpenAICritiqueRunner | None = None
+
+    # API clients are created when a pipeline is set up (create_context) or
+    # on first use, not in __init__: importing them pulls in the OpenAI SDK
+    # and httpx, which most of the CLI never needs.
+
+    @property
+    def linear(self) -> LinearClient:
+        if self._linear is None:
+            from ai_loop.integrations.linear import LinearClient
+
+            self._linear = LinearClient()
+        return self._linear
+
+    @property
+    def claude(self) -> ClaudeRunner:
+        if self._claude is None:
+            from ai_loop.integrations.claude_runner import ClaudeRunner
+
+            self._claude = ClaudeRunner()
+        return self._claude
+
+    @property
+    def critique(self) -> OpenAICritiqueRunner:
+        if self._critique is None:
+            from ai_loop.integrations.openai_critique_runner import OpenAICritiqueRunner
+
+            self._critique = OpenAICritiqueRunner()
+        return self._critique
+
+    def _start_clients(self, *, writeback: bool) -> None:
+        """Create the clients a run will use, so bad config (e.g. no
+        OPENAI_API_KEY) fails before any Claude call or worktree is made.
+
+        The Linear client is only needed for writeback.
+        """
+        names = ["claude", "critique"]
+        if writeback:
+            names.append("linear")
+        for name in names:
+            getattr(self, name)
 
     def _generate_run_id(self, issue_identifier: str) -> str:
         """Generate a unique run ID."""
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        short_uuid = uuid.uuid4().hex[:6]
-        safe_id = issue_identifier.replace("/", "-").lower()
-        return f"{safe_id}-{timestamp}-{short_uuid}"
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        suffix = secrets.token_hex(3)
+        return f"{safe_identifier(issue_identifier)}-{timestamp}-{suffix}"
 
     async def create_context(
         self,
@@ -68,7 +154,11 @@ class PipelineOrchestrator:
         no_linear_writeback: bool = False,
         verbose: bool = False,
     ) -> RunContext:
-        """Create a run context for an issue."""
+        """Create a run context for an issue.
+
+        The context holds the sanitized issue; the raw one is not kept.
+        """
+        self._start_clients(writeback=not no_linear_writeback and not dry_run)
         run_id = self._generate_run_id(issue.identifier)
         artifacts_dir = self.artifacts.get_run_dir(run_id)
         branch_name = self.git.generate_branch_name(issue.identifier)
@@ -79,7 +169,7 @@ class PipelineOrchestrator:
 
         return RunContext(
             run_id=run_id,
-            issue=issue,
+            issue=self._sanitize_issue(issue),
             repo_root=self.repo_root,
             artifacts_dir=artifacts_dir,
             worktree_dir=worktree_dir,
@@ -95,19 +185,11 @@ class PipelineOrchestrator:
 
     def _sanitize_issue(self, issue: LinearIssue) -> LinearIssue:
         """Sanitize issue content for safe prompt construction."""
-        return LinearIssue(
-            id=issue.id,
-            identifier=issue.identifier,
+        return replace(
+            issue,
             title=sanitize_issue_title(issue.title),
             description=sanitize_issue_content(issue.description),
-            state=issue.state,
-            priority=issue.priority,
-            team_id=issue.team_id,
-            team_name=issue.team_name,
-            project_id=issue.project_id,
-            project_name=issue.project_name,
             labels=issue.labels[:10],  # Limit labels
-            url=issue.url,
         )
 
     def _check_gate(
@@ -120,14 +202,19 @@ class PipelineOrchestrator:
             return GateResult.PASS
         return GateResult.FAIL
 
+    def _retry_likely(self, gates: list[CritiqueResult], threshold: int) -> bool:
+        """Whether a refine/fix round is likely to be followed by another:
+        the last two gates both failed, so the loop is not converging yet."""
+        recent = gates[-2:]
+        return len(recent) == 2 and all(
+            self._check_gate(c, threshold) == GateResult.FAIL for c in recent
+        )
+
     def _detect_stuck(self, ctx: RunContext) -> bool:
         """Detect if the pipeline is stuck (repeating plans)."""
-        if len(ctx.plan_versions) < 3:
-            return False
-
         # Check if last 3 plans have same hash
-        recent_hashes = [p.hash for p in ctx.plan_versions[-3:]]
-        return len(set(recent_hashes)) == 1
+        recent = ctx.recent_plan_hashes
+        return len(recent) == 3 and recent[0] == recent[1] == recent[2]
 
     def _should_block_at_gate(
         self,
@@ -150,6 +237,28 @@ class PipelineOrchestrator:
 
         return False
 
+    async def _setup_git_isolation(
+        self,
+        ctx: RunContext,
+        log: Callable[[str, dict | None], None],
+    ) -> None:
+        """Create the run's worktree, or its branch when not using one.
+
+        With a worktree pool, a free slot is reused instead of checking out a
+        new worktree (falling back to the per-run one when all are busy).
+        """
+        if ctx.use_worktree and ctx.worktree_dir:
+            slot = self.worktree_pool.acquire() if self.worktree_pool else None
+            if slot is not None:
+                ctx.worktree_dir = slot  # Set first so the slot is released on failure
+                await self.worktree_pool.checkout(slot, ctx.branch_name)
+            else:
+                await self.git.create_worktree(ctx.branch_name, ctx.worktree_dir)
+            log("worktree_created", {"path": str(ctx.worktree_dir)})
+        else:
+            await self.git.create_branch(ctx.branch_name)
+            log("branch_created", {"branch": ctx.branch_name})
+
     async def _wait_for_gate_resolution(
         self,
         ctx: RunContext,
@@ -160,12 +269,11 @@ class PipelineOrchestrator:
         """
         Wait for human resolution at a gate.
 
-        Writes gate_pending.json, polls for gate_resolution.json.
+        Writes gate_pending.json, then waits for gate_resolution.json.
         Returns the action: 'approve', 'reject', or 'request_changes'.
         """
-        run_dir = self.artifacts_root / ctx.run_id
-        pending_path = run_dir / "gate_pending.json"
-        resolution_path = run_dir / "gate_resolution.json"
+        pending_path = ctx.gate_pending_path
+        resolution_path = ctx.gate_resolution_path
 
         # Write gate_pending.json
         pending_data = {
@@ -179,7 +287,7 @@ class PipelineOrchestrator:
                 "feedback": critique.feedback,
             },
         }
-        pending_path.write_text(json.dumps(pending_data, indent=2))
+        pending_path.write_bytes(fastjson.dumps(pending_data, indent=True))
 
         # Log the gate pending event (SSE will pick this up)
         log("gate_pending", {
@@ -187,50 +295,82 @@ class PipelineOrchestrator:
             "critique": pending_data["critique"],
         })
 
-        # Poll for resolution (2s initially, 5s after 60s)
-        start_time = datetime.now()
-        timeout = 30 * 60  # 30 minutes
-        poll_interval = 2  # Start with 2s
-
-        while True:
-            elapsed = (datetime.now() - start_time).total_seconds()
-
-            # Check timeout
-            if elapsed > timeout:
-                # Auto-reject on timeout
-                resolution_path.write_text(json.dumps({
-                    "action": "reject",
-                    "feedback": "Timed out (30m)",
-                    "resolved_at": datetime.now().isoformat(),
-                }))
-
-            # Check for resolution file
-            if resolution_path.exists():
-                try:
-                    resolution = json.loads(resolution_path.read_text())
-                    action = resolution.get("action", "reject")
-                    feedback = resolution.get("feedback", "")
-
-                    # Store feedback for next iteration
-                    if feedback:
-                        ctx.human_feedback = feedback
-
-                    # Clean up files
-                    pending_path.unlink(missing_ok=True)
-                    resolution_path.unlink(missing_ok=True)
-
-                    # Log resolution
-                    log("gate_resolved", {"action": action, "feedback": feedback})
+        # Wait for the resolution file: woken by filesystem events when
+        # watchfiles is installed, by polling otherwise
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        changed = asyncio.Event()
+        poll_interval = GATE_POLL_INTERVAL
+        watcher = (
+            asyncio.create_task(self._watch_for_file(resolution_path, changed))
+            if watchfiles is not None
+            else None
+        )
 
-                    return action
-                except (json.JSONDecodeError, IOError):
+        try:
+            while True:
+                elapsed = loop.time() - start_time
+
+                # Check timeout
+                if elapsed > GATE_RESOLUTION_TIMEOUT:
+                    # Auto-reject on timeout
+                    resolution_path.write_bytes(fastjson.dumps({
+                        "action": "reject",
+                        "feedback": "Timed out (30m)",
+                        "resolved_at": datetime.now().isoformat(),
+                    }))
+
+                # Check for resolution file
+                if resolution_path.exists():
+                    try:
+                        resolution = fastjson.loads(resolution_path.read_bytes())
+                        action = resolution.get("action", "reject")
+                        feedback = resolution.get("feedback", "")
+
+                        # Store feedback for next iteration
+                        if feedback:
+                            ctx.human_feedback = feedback
+
+                        # Clean up files
+                        pending_path.unlink(missing_ok=True)
+                        resolution_path.unlink(missing_ok=True)
+
+                        # Log resolution
+                        log("gate_resolved", {"action": action, "feedback": feedback})
+
+                        return action
+                    except (fastjson.JSONDecodeError, IOError):
+                        pass  # Partially written; wait for the next change
+
+                if watcher is not None and not watcher.done():
+                    interval = GATE_WATCH_SAFETY_INTERVAL
+                else:
+                    interval = poll_interval
+                    poll_interval = min(poll_interval * GATE_POLL_BACKOFF, GATE_POLL_INTERVAL_MAX)
+                remaining = GATE_RESOLUTION_TIMEOUT - elapsed
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=max(min(interval, remaining), 0))
+                except asyncio.TimeoutError:
                     pass
-
-            # Backoff after 60s
-            if elapsed > 60:
-                poll_interval = 5
-
-            await asyncio.sleep(poll_interval)
+                changed.clear()
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+                await asyncio.gather(watcher, return_exceptions=True)
+
+    @staticmethod
+    async def _watch_for_file(path: Path, changed: asyncio.Event) -> None:
+        """Set ``changed`` whenever ``path`` is created or modified."""
+        # Watch the resolved directory so reported paths compare as plain
+        # strings; the filter drops every other file (trace appends etc.)
+        # before a batch is yielded, so those never wake this task.
+        target = str(path.resolve())
+        async for _ in watchfiles.awatch(
+            Path(target).parent,
+            watch_filter=lambda _change, changed_path: changed_path == target,
+            recursive=False,
+        ):
+            changed.set()
 
     async def run_pipeline(
         self,
@@ -249,6 +389,10 @@ class PipelineOrchestrator:
         """
         ctx.started_at = datetime.now()
 
+        # Batch trace writes while any pipeline on this orchestrator is running
+        self._active_runs += 1
+        self.artifacts.start_flusher()
+
         def update_status(status: RunStatus) -> None:
             ctx.status = status
             if on_status_change:
@@ -260,36 +404,35 @@ class PipelineOrchestrator:
                 on_event(event_type, data or {})
 
         try:
-            # Sanitize issue
-            safe_issue = self._sanitize_issue(ctx.issue)
-            issue_pack = safe_issue.to_issue_pack()
+            issue_pack = ctx.issue.issue_pack
             self.artifacts.write_issue_pack(ctx, issue_pack)
             log("pipeline_started", {"issue": ctx.issue.identifier})
 
             # Terminal logging for visibility
-            term_log("PIPELINE", f"Starting run for {ctx.issue.identifier}")
-            term_log("PIPELINE", f"Run ID: {ctx.run_id}")
-            term_log("PIPELINE", f"Mode: {'dry-run' if ctx.dry_run else 'write'}")
-
-            # Setup git isolation (unless dry run)
-            if not ctx.dry_run:
-                if ctx.use_worktree and ctx.worktree_dir:
-                    await self.git.create_worktree(ctx.branch_name, ctx.worktree_dir)
-                    log("worktree_created", {"path": str(ctx.worktree_dir)})
-                else:
-                    await self.git.create_branch(ctx.branch_name)
-                    log("branch_created", {"branch": ctx.branch_name})
+            term_log_lines("PIPELINE", [
+                f"Starting run for {ctx.issue.identifier}",
+                f"Run ID: {ctx.run_id}",
+                f"Mode: {'dry-run' if ctx.dry_run else 'write'}",
+            ])
 
             # === PLANNING PHASE ===
             update_status(RunStatus.PLANNING)
             log("planning_started")
             term_log("PLANNING", "Generating plan with Claude...")
 
-            # Generate initial plan
-            plan_content = await self.claude.generate_plan(safe_issue, ctx.repo_root)
+            # Generate initial plan. Planning reads repo_root at the same
+            # commit the branch starts from, so git isolation (unless dry
+            # run) is set up alongside it.
+            if ctx.dry_run:
+                plan_content = await self.claude.generate_plan(ctx.issue, ctx.repo_root)
+            else:
+                plan_content, _ = await _gather_or_cancel(
+                    self.claude.generate_plan(ctx.issue, ctx.repo_root),
+                    self._setup_git_isolation(ctx, log),
+                )
             ctx.current_iteration = 1
             plan = PlanVersion(version=1, content=plan_content)
-            ctx.plan_versions.append(plan)
+            ctx.add_plan_version(plan)
             self.artifacts.write_plan(ctx, 1, plan_content)
             log("plan_generated", {"version": 1})
 
@@ -375,15 +518,17 @@ class PipelineOrchestrator:
                 ctx.human_feedback = ""  # Clear after use
 
                 refined = await self.claude.refine_plan(
-                    safe_issue,
+                    ctx.issue,
                     ctx.plan_versions[-1].content,
                     critique,
                     ctx.current_iteration - 1,
                     ctx.repo_root,
                     human_feedback=human_feedback,
+                    more_expected=ctx.current_iteration < ctx.max_iterations
+                    and self._retry_likely(ctx.plan_gates, ctx.confidence_threshold),
                 )
                 plan = PlanVersion(version=ctx.current_iteration, content=refined)
-                ctx.plan_versions.append(plan)
+                ctx.add_plan_version(plan)
                 self.artifacts.write_plan(ctx, ctx.current_iteration, refined)
                 log("plan_refined", {"version": ctx.current_iteration})
 
@@ -400,7 +545,9 @@ class PipelineOrchestrator:
                 term_log("IMPLEMENTING", "Claude implementing final plan...")
 
                 implement_log = await self.claude.implement(ctx.final_plan, ctx)
-                self.artifacts.write_implement_log(ctx, implement_log)
+                # Claude transcripts can be large; redact and write them off
+                # the event loop so concurrent runs keep streaming
+                await asyncio.to_thread(self.artifacts.write_implement_log, ctx, implement_log)
                 log("implementation_completed")
 
                 # === CODE_GATE LOOP ===
@@ -410,8 +557,15 @@ class PipelineOrchestrator:
                     log("code_gate_started", {"fix_iteration": fix_iteration})
                     term_log("CODE_GATE", "Running code critique...")
 
-                    # Get diff and run tests
-                    git_diff = await self.git.get_diff(ctx.working_dir())
+                    # Get diff (and load the critique prompt meanwhile) and run tests
+                    if ctx.diff_base is None:
+                        ctx.diff_base = await self.git.get_merge_base(ctx.working_dir())
+                    git_diff, system_prompt = await asyncio.gather(
+                        self.git.get_diff_bounded(
+                            ctx.working_dir(), self.max_diff_chars, ctx.diff_base
+                        ),
+                        self.critique.prepare_code_gate(),
+                    )
                     # TODO: Actually run tests and capture output
                     test_results = None
 
@@ -421,6 +575,7 @@ class PipelineOrchestrator:
                         test_results,
                         fix_iteration,
                         ctx,
+                        system=system_prompt,
                     )
                     ctx.code_gates.append(critique)
                     log(
@@ -475,8 +630,14 @@ class PipelineOrchestrator:
                                 critique,
                                 ctx,
                                 human_feedback=human_feedback,
+                                more_expected=fix_iteration + 1 < MAX_FIX_ITERATIONS
+                                and self._retry_likely(
+                                    ctx.code_gates, ctx.confidence_threshold
+                                ),
+                            )
+                            await asyncio.to_thread(
+                                self.artifacts.write_fix_log, ctx, fix_iteration, fix_log
                             )
-                            self.artifacts.write_fix_log(ctx, fix_iteration, fix_log)
                             log("fix_applied", {"iteration": fix_iteration})
                         else:
                             ctx.status = RunStatus.FAILED
@@ -495,8 +656,22 @@ class PipelineOrchestrator:
         finally:
             ctx.completed_at = datetime.now()
             self.artifacts.write_summary(ctx)
-            log("pipeline_completed", {"status": ctx.status.value})
-            term_log("PIPELINE", f"Completed with status: {ctx.status.value}")
+            log("pipeline_completed", {"status": ctx.status})
+            self.artifacts.close_trace(ctx)
+            term_log("PIPELINE", f"Completed with status: {ctx.status}")
+
+            # A spare left in this run's worktree would otherwise idle until
+            # the batch ends (or start on a reused slot's old checkout)
+            if self._claude is not None:
+                await self._claude.discard(ctx.working_dir())
+            if self.worktree_pool and ctx.worktree_dir:
+                self.worktree_pool.release(ctx.worktree_dir)
+
+            self._active_runs -= 1
+            if not self._active_runs:
+                await self.artifacts.stop_flusher()
+                if self._claude is not None:  # Created on first use
+                    await self._claude.close()
 
             # Cleanup worktree on failure (optional)
             # if ctx.worktree_dir and ctx.status == RunStatus.FAILED:
@@ -518,7 +693,7 @@ class PipelineOrchestrator:
         comment = f"""## AI Loop Run {status_emoji}
 
 **Run ID:** `{ctx.run_id}`
-**Status:** {ctx.status.value}
+**Status:** {ctx.status}
 **Iterations:** {ctx.current_iteration}
 **Final Confidence:** {confidence}
 **Branch:** `{ctx.branch_name}`
@@ -3,72 +3,180 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import signal
 import subprocess
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ai_loop.config import get_settings, get_prompts_dir
+from ai_loop.config import get_settings, get_prompts_dir, load_prompt
 from ai_loop.core.logging import log
 
 if TYPE_CHECKING:
     from ai_loop.core.models import CritiqueResult, LinearIssue, RunContext
 
+# Seconds a stopped Claude process group gets after SIGTERM before SIGKILL
+KILL_GRACE_PERIOD = 2
+
+# A spare idle longer than this is replaced rather than trusted with a prompt
+SPARE_MAX_IDLE = 300
+
+# Start each Claude process in a new process group. POSIX stops the whole
+# group with killpg; Windows has no killpg, so only the CLI itself is stopped.
+if os.name == "nt":  # pragma: no cover - Windows only
+    _NEW_PROCESS_GROUP: dict = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _NEW_PROCESS_GROUP = {"process_group": 0}
+
 
 class ClaudeRunner:
-    """Runner for Claude CLI subprocess."""
+    """Runner for Claude CLI subprocess.
+
+    Each call is a fresh ``claude --print`` process (no state carries over
+    between prompts), but the prompt goes in on stdin, so the next process can
+    be started ahead of time. When another call is expected (refine and fix
+    loops), a spare process is left booting in the same working directory and
+    the next call there takes it instead of paying CLI startup again (unless
+    it has exited or idled past ``SPARE_MAX_IDLE``).
+    ``discard()`` stops the spare for one directory, ``close()`` all of them.
+    """
 
     def __init__(self, cmd: str | None = None):
         settings = get_settings()
         self.cmd = cmd or settings.claude_cmd
         self.prompts_dir = get_prompts_dir()
+        # Idle pre-started processes (with start time), one per working directory
+        self._spares: dict[Path | None, tuple[asyncio.subprocess.Process, float]] = {}
 
     def _load_prompt(self, name: str) -> str:
-        """Load a prompt template."""
-        path = self.prompts_dir / f"{name}.md"
-        if not path.exists():
-            raise FileNotFoundError(f"Prompt not found: {path}")
-        return path.read_text()
+        """Load a prompt template (cached until the file changes)."""
+        return load_prompt(self.prompts_dir, name)
+
+    async def _spawn(self, cwd: Path | None) -> asyncio.subprocess.Process:
+        """Start a Claude CLI process that waits for its prompt on stdin.
+
+        It leads its own process group so that stopping it also stops the
+        tools and shells it has started (see ``_kill``).
+        """
+        return await asyncio.create_subprocess_exec(
+            self.cmd,
+            "--print",
+            cwd=cwd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **_NEW_PROCESS_GROUP,
+        )
+
+    @staticmethod
+    def _signal_group(proc: asyncio.subprocess.Process, force: bool) -> None:
+        """SIGTERM (or SIGKILL if ``force``) a Claude process group.
+
+        Without killpg (Windows) this falls back to terminate()/kill() on the
+        CLI process alone.
+        """
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+            elif proc.returncode is not None:
+                pass
+            elif force:
+                proc.kill()
+            else:
+                proc.terminate()
+        except ProcessLookupError:
+            pass
+
+    @classmethod
+    async def _kill(cls, proc: asyncio.subprocess.Process) -> None:
+        """Stop a Claude process and everything in its process group.
+
+        SIGTERM first; whatever is still running after the grace period
+        (including children that outlive the CLI itself) gets SIGKILL.
+        """
+        cls._signal_group(proc, force=False)
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=KILL_GRACE_PERIOD)
+        except asyncio.TimeoutError:
+            pass
+        cls._signal_group(proc, force=True)
+        await proc.wait()
+
+    async def _take_process(self, cwd: Path | None) -> asyncio.subprocess.Process:
+        """Take the spare for ``cwd`` if it is alive and fresh, else start one."""
+        spare = self._spares.pop(cwd, None)
+        if spare is not None:
+            proc, started = spare
+            if proc.returncode is None:
+                if time.monotonic() - started <= SPARE_MAX_IDLE:
+                    return proc
+                await self._kill(proc)
+        return await self._spawn(cwd)
+
+    async def _prestart(self, cwd: Path | None) -> None:
+        """Leave a spare process booting for the next call in ``cwd``."""
+        if cwd in self._spares:
+            return
+        try:
+            self._spares[cwd] = (await self._spawn(cwd), time.monotonic())
+        except OSError:
+            pass  # Next call spawns (and reports) on its own
+
+    async def discard(self, cwd: Path | None) -> None:
+        """Stop the idle spare for ``cwd``, if any (e.g. when a run ends)."""
+        spare = self._spares.pop(cwd, None)
+        if spare is not None:
+            await self._kill(spare[0])
+
+    async def close(self) -> None:
+        """Stop idle spare processes."""
+        spares, self._spares = self._spares, {}
+        for proc, _ in spares.values():
+            await self._kill(proc)
 
     async def _run_claude(
         self,
         prompt: str,
         cwd: Path | None = None,
         timeout: int = 300,
+        prestart: bool = False,
     ) -> tuple[str, str]:
-        """Run Claude CLI with prompt via stdin, return (stdout, stderr)."""
-        log("CLAUDE", f"Invoking: {self.cmd} --print -p <prompt>")
+        """Run Claude CLI with prompt via stdin, return (stdout, stderr).
+
+        With ``prestart``, a spare is left booting in ``cwd`` afterwards; only
+        ask for one when another call there is likely (a refine/fix loop that
+        keeps failing its gate).
+        """
+        log("CLAUDE", f"Invoking: {self.cmd} --print <prompt on stdin>")
         log("CLAUDE", f"Working dir: {cwd}")
         log("CLAUDE", f"Timeout: {timeout}s")
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        proc = await asyncio.create_subprocess_exec(
-            self.cmd,
-            "--print",
-            "-p", prompt,
-            cwd=cwd,
-            stdin=asyncio.subprocess.DEVNULL,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        proc = await self._take_process(cwd)
         try:
             stdout, stderr = await asyncio.wait_for(
-                proc.communicate(),
+                proc.communicate(prompt.encode()),
                 timeout=timeout,
             )
         except asyncio.TimeoutError:
-            proc.kill()
-            await proc.wait()
+            await self._kill(proc)
             raise TimeoutError(f"Claude timed out after {timeout}s")
+        except asyncio.CancelledError:
+            # Not in our process group, so a stopped batch doesn't reach it
+            await self._kill(proc)
+            raise
 
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
 
         if proc.returncode != 0:
             raise RuntimeError(
                 f"Claude exited with code {proc.returncode}: {stderr.decode()}"
             )
 
+        if prestart:
+            await self._prestart(cwd)
         log("CLAUDE", f"Completed in {elapsed:.1f}s, output: {len(stdout)} chars")
         return stdout.decode(), stderr.decode()
 
@@ -79,7 +187,7 @@ class ClaudeRunner:
     ) -> str:
         """Generate initial implementation plan."""
         template = self._load_prompt("claude_planner")
-        issue_pack = issue.to_issue_pack()
+        issue_pack = issue.issue_pack
         prompt = f"{template}\n\n---\n\n{issue_pack}"
         stdout, _ = await self._run_claude(prompt, cwd=repo_root, timeout=600)
         return stdout
@@ -92,10 +200,14 @@ class ClaudeRunner:
         version: int,
         repo_root: Path,
         human_feedback: str = "",
+        more_expected: bool = False,
     ) -> str:
-        """Refine plan based on critique feedback."""
+        """Refine plan based on critique feedback.
+
+        ``more_expected``: another refinement may follow (pre-start for it).
+        """
         template = self._load_prompt("claude_refiner")
-        issue_pack = issue.to_issue_pack()
+        issue_pack = issue.issue_pack
 
         critique_text = f"""
 ## Critique Result (v{version})
@@ -146,7 +258,9 @@ class ClaudeRunner:
 {critique_text}
 {human_feedback_section}
 """
-        stdout, _ = await self._run_claude(prompt, cwd=repo_root, timeout=600)
+        stdout, _ = await self._run_claude(
+            prompt, cwd=repo_root, timeout=600, prestart=more_expected
+        )
         return stdout
 
     async def implement(
@@ -184,8 +298,12 @@ class ClaudeRunner:
         critique: CritiqueResult,
         ctx: RunContext,
         human_feedback: str = "",
+        more_expected: bool = False,
     ) -> str:
-        """Fix code based on CODE_GATE critique."""
+        """Fix code based on CODE_GATE critique.
+
+        ``more_expected``: another fix may follow (pre-start for it).
+        """
         template = self._load_prompt("claude_implementer")
         working_dir = ctx.working_dir()
 
@@ -230,5 +348,7 @@ class ClaudeRunner:
 - Preserve existing intent
 - Run tests after fixes
 """
-        stdout, _ = await self._run_claude(prompt, cwd=working_dir, timeout=600)
+        stdout, _ = await self._run_claude(
+            prompt, cwd=working_dir, timeout=600, prestart=more_expected
+        )
         return stdout
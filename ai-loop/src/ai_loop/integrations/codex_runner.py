@@ -9,7 +9,8 @@ import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, AsyncIterator
 
-from ai_loop.config import get_settings, get_prompts_dir, get_schemas_dir
+from ai_loop.config import get_settings, get_prompts_dir, get_schemas_dir, load_prompt
+from ai_loop.core import fastjson
 from ai_loop.core.models import CritiqueResult
 
 if TYPE_CHECKING:
@@ -19,7 +20,20 @@ logger = logging.getLogger(__name__)
 
 # Module-level cache keyed by codex command path (survives batch/concurrency)
 _CODEX_CAPS_CACHE: dict[str, dict[str, bool]] = {}
+# Probe in flight per command, so concurrent first gates share one --help run
+_CODEX_CAPS_PROBES: dict[str, asyncio.Future[dict[str, bool]]] = {}
 _DETECTION_TIMEOUT = 10  # seconds - fail closed if exceeded
+# Bytes of codex exec stderr kept for error messages (the rest is dropped)
+CODEX_STDERR_TAIL = 64 * 1024
+
+
+async def _drain_tail(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Read a stream to EOF, keeping only its last ``limit`` bytes."""
+    tail = bytearray()
+    while chunk := await stream.read(65536):
+        tail += chunk
+        del tail[:-limit]
+    return bytes(tail)
 
 
 class CodexRunner:
@@ -30,13 +44,12 @@ class CodexRunner:
         self.cmd = cmd or settings.codex_cmd
         self.prompts_dir = get_prompts_dir()
         self.schemas_dir = get_schemas_dir()
+        # "codex exec" plus capability-dependent flags, built on first use
+        self._exec_prefix: list[str] | None = None
 
     def _load_prompt(self, name: str) -> str:
-        """Load a prompt template."""
-        path = self.prompts_dir / f"{name}.md"
-        if not path.exists():
-            raise FileNotFoundError(f"Prompt not found: {path}")
-        return path.read_text()
+        """Load a prompt template (cached until the file changes)."""
+        return load_prompt(self.prompts_dir, name)
 
     def _get_schema_path(self) -> Path:
         """Get path to critique schema."""
@@ -53,6 +66,16 @@ class CodexRunner:
         if self.cmd in _CODEX_CAPS_CACHE:
             return _CODEX_CAPS_CACHE[self.cmd]
 
+        probe = _CODEX_CAPS_PROBES.get(self.cmd)
+        if probe is None or probe.get_loop() is not asyncio.get_running_loop():
+            probe = _CODEX_CAPS_PROBES[self.cmd] = asyncio.ensure_future(
+                self._probe_codex_capabilities()
+            )
+        # Shielded: one cancelled gate must not cancel the probe for the others
+        return await asyncio.shield(probe)
+
+    async def _probe_codex_capabilities(self) -> dict[str, bool]:
+        """Run the --help probe and store the result in the module cache."""
         try:
             proc = await asyncio.create_subprocess_exec(
                 self.cmd, "exec", "--help",
@@ -97,6 +120,7 @@ class CodexRunner:
             }
 
         _CODEX_CAPS_CACHE[self.cmd] = caps
+        _CODEX_CAPS_PROBES.pop(self.cmd, None)
         return caps
 
     async def _build_codex_args(
@@ -108,6 +132,20 @@ class CodexRunner:
         which would need routing to trace.jsonl while still relying on -o for
         structured output. Orchestrator stage events provide sufficient visibility.
         """
+        if self._exec_prefix is None:
+            self._exec_prefix = await self._build_exec_prefix()
+
+        # V1: Don't use --json. Rely on orchestrator stage events for visibility.
+        # Future: If --json enabled, capture JSONL stream to trace.jsonl
+        return [
+            *self._exec_prefix,
+            "--output-schema", str(schema_path),
+            "-o", str(output_path),
+            prompt,
+        ]
+
+    async def _build_exec_prefix(self) -> list[str]:
+        """Command and flags that depend only on detected capabilities."""
         caps = await self._detect_codex_capabilities()
 
         args = [self.cmd, "exec"]
@@ -118,21 +156,14 @@ class CodexRunner:
         elif caps["full_auto"]:
             args.append("--full-auto")
         else:
-            # Log once, continue without - Codex will use defaults
-            if not hasattr(self, "_logged_no_approval"):
-                logger.warning("Codex: approval mode unsupported; using defaults")
-                self._logged_no_approval = True
+            # Logged once per runner (the prefix is built once), continue
+            # without - Codex will use defaults
+            logger.warning("Codex: approval mode unsupported; using defaults")
 
         # Quiet mode: only add if supported
         if caps["quiet"]:
             args.append("-q")
 
-        args.extend(["--output-schema", str(schema_path), "-o", str(output_path)])
-
-        # V1: Don't use --json. Rely on orchestrator stage events for visibility.
-        # Future: If --json enabled, capture JSONL stream to trace.jsonl
-
-        args.append(prompt)
         return args
 
     async def _run_codex_exec(
@@ -156,14 +187,17 @@ class CodexRunner:
             *cmd_parts,
             cwd=cwd,
             stdin=asyncio.subprocess.DEVNULL,
-            stdout=asyncio.subprocess.PIPE,
+            # The critique is read from -o; stdout is never used
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
 
         try:
-            # V1: Just wait for completion, no JSONL streaming
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=timeout
+            # V1: Just wait for completion, no JSONL streaming. Only the tail
+            # of stderr is kept, so long runs don't accumulate diagnostics.
+            stderr, _ = await asyncio.wait_for(
+                asyncio.gather(_drain_tail(proc.stderr, CODEX_STDERR_TAIL), proc.wait()),
+                timeout=timeout,
             )
         except asyncio.TimeoutError:
             proc.kill()
@@ -176,8 +210,7 @@ class CodexRunner:
             # Check if output was still produced (Codex can succeed with warnings)
             if output_path.exists():
                 try:
-                    with open(output_path) as f:
-                        data = json.load(f)
+                    data = fastjson.loads(output_path.read_bytes())
                     # Valid JSON output exists - log warning but continue
                     if data:  # Non-empty output
                         logger.warning(
@@ -188,7 +221,7 @@ class CodexRunner:
                     pass  # Invalid output - fall through to raise error
 
             raise RuntimeError(
-                f"Codex exited with code {proc.returncode}: {stderr.decode()}"
+                f"Codex exited with code {proc.returncode}: {stderr.decode(errors='replace')}"
             )
 
     async def plan_gate(
@@ -273,7 +306,4 @@ class CodexRunner:
         if not output_path.exists():
             raise FileNotFoundError(f"Codex output not found: {output_path}")
 
-        with open(output_path) as f:
-            data = json.load(f)
-
-        return CritiqueResult.model_validate(data)
+        return CritiqueResult.model_validate_json(output_path.read_bytes())
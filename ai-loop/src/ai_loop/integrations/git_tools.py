@@ -3,10 +3,59 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
+import re
 import subprocess
-from datetime import datetime
+import time
 from pathlib import Path
 
+from ai_loop.safety.sanitizer import safe_identifier
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+@functools.lru_cache(maxsize=None)
+def _repo_root_for(cwd: Path) -> Path:
+    """Resolve the git repository root containing cwd (cached per directory)."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return Path(result.stdout.strip())
+
+
+# Start of each file's section in a unified diff
+_DIFF_FILE_RE = re.compile(r"^diff --git a/.* b/(.*)$", re.MULTILINE)
+
+
+def _truncate_diff(diff: str, max_chars: int) -> str:
+    """Cut a diff to whole files fitting in ``max_chars``, noting what was left out.
+
+    If even the first file is too large, it is cut at a line boundary.
+    """
+    starts = [m.start() for m in _DIFF_FILE_RE.finditer(diff)] or [0]
+    ends = starts[1:] + [len(diff)]
+    kept = 0
+    while kept < len(starts) and ends[kept] <= max_chars:
+        kept += 1
+    if kept:
+        shown = diff[: ends[kept - 1]]
+    else:
+        shown = diff[: diff.rfind("\n", 0, max_chars) + 1]
+    omitted = [m.group(1) for m in _DIFF_FILE_RE.finditer(diff, len(shown))]
+    note = f"[diff truncated: showing {len(shown):,} of {len(diff):,} characters"
+    if omitted:
+        note += f"; files not shown: {', '.join(omitted)}"
+    return f"{shown.rstrip()}\n{note}]"
+
 
 class GitTools:
     """Git operations helper."""
@@ -17,13 +66,7 @@ class GitTools:
     @staticmethod
     def _detect_repo_root() -> Path:
         """Detect git repository root."""
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return Path(result.stdout.strip())
+        return _repo_root_for(Path.cwd())
 
     def _run_git(self, *args: str, cwd: Path | None = None) -> str:
         """Run a git command and return stdout."""
@@ -52,10 +95,8 @@ class GitTools:
 
     def generate_branch_name(self, issue_identifier: str) -> str:
         """Generate a branch name for an issue."""
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        # Sanitize identifier
-        safe_id = issue_identifier.replace("/", "-").lower()
-        return f"agent/{safe_id}-jobs-grade-{timestamp}"
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        return f"agent/{safe_identifier(issue_identifier)}-jobs-grade-{timestamp}"
 
     async def create_branch(self, branch_name: str) -> None:
         """Create and checkout a new branch."""
@@ -76,23 +117,51 @@ class GitTools:
             str(worktree_dir),
         )
 
+    async def reuse_worktree(self, branch_name: str, worktree_dir: Path) -> None:
+        """Reset an existing worktree and check out a new branch from HEAD.
+
+        Discards everything left in it (including ignored files); commits on
+        the previous branch are kept in the repository.
+        """
+        head = await self._run_git_async("rev-parse", "HEAD")
+        await self._run_git_async("reset", "--hard", cwd=worktree_dir)
+        await self._run_git_async("clean", "-fdx", cwd=worktree_dir)
+        await self._run_git_async("checkout", "-B", branch_name, head, cwd=worktree_dir)
+
     async def remove_worktree(self, worktree_dir: Path) -> None:
         """Remove a git worktree."""
         await self._run_git_async("worktree", "remove", str(worktree_dir), "--force")
 
-    async def get_diff(self, cwd: Path | None = None) -> str:
-        """Get the diff of all changes (staged and unstaged)."""
-        # Get diff against main/master
-        try:
-            base = await self._run_git_async("merge-base", "HEAD", "main", cwd=cwd)
-        except RuntimeError:
+    async def get_merge_base(self, cwd: Path | None = None) -> str | None:
+        """Get the merge-base of HEAD with main/master, or None if neither exists."""
+        for base_branch in ("main", "master"):
             try:
-                base = await self._run_git_async("merge-base", "HEAD", "master", cwd=cwd)
+                return await self._run_git_async("merge-base", "HEAD", base_branch, cwd=cwd)
             except RuntimeError:
-                base = "HEAD~1"
-
+                pass
+        return None
+
+    async def get_diff(self, cwd: Path | None = None, base: str | None = None) -> str:
+        """Get the diff of all changes (staged and unstaged).
+
+        Taken against ``base`` when given (see get_merge_base), otherwise
+        against the merge-base with main/master, looked up now.
+        """
+        if base is None:
+            base = await self.get_merge_base(cwd)
+        if base is None:
+            return await self._run_git_async("diff", "HEAD~1", "HEAD", cwd=cwd)
         return await self._run_git_async("diff", base, "HEAD", cwd=cwd)
 
+    async def get_diff_bounded(
+        self, cwd: Path | None = None, max_chars: int = 0, base: str | None = None
+    ) -> str:
+        """Get the diff, cut to whole files within ``max_chars`` (0 = no limit)."""
+        diff = await self.get_diff(cwd, base)
+        if max_chars and len(diff) > max_chars:
+            return _truncate_diff(diff, max_chars)
+        return diff
+
     async def get_current_branch(self, cwd: Path | None = None) -> str:
         """Get the current branch name."""
         return await self._run_git_async("branch", "--show-current", cwd=cwd)
@@ -110,3 +179,73 @@ class GitTools:
     def get_repo_root(self) -> Path:
         """Return the repository root path."""
         return self.repo_root
+
+
+class WorktreePool:
+    """Fixed set of reusable worktrees, ``<root>/slot-0`` .. ``slot-<size-1>``.
+
+    A slot is held through an exclusive OS lock on ``slot-N.lock`` (flock, or
+    msvcrt on Windows), so concurrent runs (including other processes) never
+    share one. The kernel drops the lock when its owner exits, so a slot left
+    by a crashed or killed batch is free again without any cleanup.
+    """
+
+    def __init__(self, git: GitTools, root: Path, size: int):
+        self.git = git
+        self.root = root
+        self.size = size
+        # Open lock file descriptor per slot claimed by this pool
+        self._held: dict[Path, int] = {}
+
+    def acquire(self) -> Path | None:
+        """Claim a free slot, or None if all are in use."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        for index in range(self.size):
+            slot = self.root / f"slot-{index}"
+            fd = self._try_lock(self._lock_path(slot))
+            if fd is not None:
+                self._held[slot] = fd
+                return slot
+        return None
+
+    @staticmethod
+    def _try_lock(lock: Path) -> int | None:
+        """Lock ``lock`` without blocking; the open fd, or None if it is held."""
+        fd = os.open(lock, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover - Windows only
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return None
+        # Owner PID, for humans inspecting the pool; the lock is what counts
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        return fd
+
+    async def checkout(self, slot: Path, branch_name: str) -> None:
+        """Put ``branch_name`` (new, from HEAD) in a claimed slot."""
+        if (slot / ".git").exists():
+            await self.git.reuse_worktree(branch_name, slot)
+        else:
+            await self.git.create_worktree(branch_name, slot)
+
+    def release(self, slot: Path) -> None:
+        """Return a slot to the pool (slots this pool does not hold are ignored).
+
+        The lock file itself stays: unlinking it would let a process that
+        opened the old file lock it while another locks a freshly created one.
+        """
+        fd = self._held.pop(slot, None)
+        if fd is None:
+            return
+        if fcntl is None:  # pragma: no cover - Windows only
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)  # Closing releases the flock
+
+    @staticmethod
+    def _lock_path(slot: Path) -> Path:
+        return slot.with_name(f"{slot.name}.lock")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 
 from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
@@ -13,7 +14,7 @@ from tenacity import (
     wait_exponential,
 )
 
-from ai_loop.config import get_prompts_dir, get_schemas_dir, get_settings
+from ai_loop.config import get_prompts_dir, get_schemas_dir, get_settings, load_prompt
 from ai_loop.core.models import CritiqueResult, RunContext
 
 # Module-level semaphore for batch concurrency control
@@ -40,12 +41,12 @@ class OpenAICritiqueRunner:
         self.max_concurrent = settings.critique_max_concurrent
 
     def _load_prompt(self, name: str) -> str:
-        """Load a prompt template from disk."""
-        path = self.prompts_dir / f"{name}.md"
-        return path.read_text()
+        """Load a prompt template (cached until the file changes)."""
+        return load_prompt(self.prompts_dir, name)
 
-    def _load_json_schema(self) -> dict:
-        """Load hand-written critique_schema.json from disk (single source of truth)."""
+    @functools.cached_property
+    def _json_schema(self) -> dict:
+        """Hand-written critique_schema.json (single source of truth), read once."""
         path = self.schemas_dir / "critique_schema.json"
         return json.loads(path.read_text())
 
@@ -64,6 +65,12 @@ class OpenAICritiqueRunner:
     ) -> CritiqueResult:
         """Single API call with retries, structured output, and fail-closed validation."""
         semaphore = _get_semaphore(self.max_concurrent)
+        # Same key for every version of a gate on one issue: those requests
+        # share the system prompt and the leading issue pack / final plan, so
+        # routing them together lets OpenAI's prefix cache hit across the loop.
+        # (Sent via extra_body: the named parameter needs a newer SDK.)
+        gate = artifact_name.rpartition("_v")[0]
+        cache_key = f"ai-loop:{gate}:{ctx.issue.identifier}"
 
         async with semaphore:
             response = await self.client.responses.create(
@@ -76,21 +83,22 @@ class OpenAICritiqueRunner:
                     "format": {
                         "type": "json_schema",
                         "name": "critique_result",
-                        "schema": self._load_json_schema(),
+                        "schema": self._json_schema,
                         "strict": True,
                     }
                 },
                 reasoning={"effort": "high"},
                 store=False,
+                extra_body={"prompt_cache_key": cache_key},
                 timeout=timeout,
             )
 
         # Fail-closed parsing: log raw response on any failure
         raw_output = response.output_text
         try:
-            data = json.loads(raw_output)
-            result = CritiqueResult.model_validate(data)
-        except (json.JSONDecodeError, Exception) as e:
+            # Parse and validate in one pass inside pydantic-core
+            result = CritiqueResult.model_validate_json(raw_output)
+        except Exception as e:
             # Log raw response to artifacts for debugging
             error_path = ctx.artifacts_dir / f"{artifact_name}_raw_error.txt"
             error_path.write_text(f"Parse error: {e}\n\nRaw output:\n{raw_output}")
@@ -130,6 +138,14 @@ class OpenAICritiqueRunner:
 
         return result
 
+    async def prepare_code_gate(self) -> str:
+        """Load the CODE_GATE system prompt off the event loop.
+
+        Independent of the diff, so callers can overlap it with diff collection
+        and pass the result to ``code_gate(system=...)``.
+        """
+        return await asyncio.to_thread(self._load_prompt, "openai_code_gate")
+
     async def code_gate(
         self,
         final_plan: str,
@@ -137,9 +153,11 @@ class OpenAICritiqueRunner:
         test_results: str | None,
         version: int,
         ctx: RunContext,
+        system: str | None = None,
     ) -> CritiqueResult:
         """Run CODE_GATE critique."""
-        system = self._load_prompt("openai_code_gate")
+        if system is None:
+            system = self._load_prompt("openai_code_gate")
 
         user = f"""## Final Plan
 {final_plan}
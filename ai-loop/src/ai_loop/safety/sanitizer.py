@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import string
 
 # Maximum content length (10KB)
 MAX_CONTENT_LENGTH = 10_000
@@ -72,6 +73,17 @@ def sanitize_issue_title(title: str) -> str:
     return title
 
 
+# Path separators to dashes and ASCII letters to lowercase, in one pass
+_SAFE_ID_TABLE = str.maketrans(
+    {"/": "-", "\\": "-", **{c: c.lower() for c in string.ascii_uppercase}}
+)
+
+
+def safe_identifier(identifier: str) -> str:
+    """Make an issue identifier safe for run IDs, paths and branch names."""
+    return identifier.translate(_SAFE_ID_TABLE)
+
+
 def escape_for_shell(value: str) -> str:
     """Escape a value for safe shell interpolation."""
     # Single quote the value and escape any single quotes within
@@ -42,6 +42,10 @@ SECRET_PATTERNS = [
     ("base64_secret", r"(?i)(secret|password|key|token)_?base64['\"]?\s*[:=]\s*['\"]?([A-Za-z0-9+/=]{40,})['\"]?"),
 ]
 
+# Compiled once at import; scanning runs on every artifact write
+_COMPILED_PATTERNS = [(name, re.compile(pattern)) for name, pattern in SECRET_PATTERNS]
+_WHITESPACE_RE = re.compile(r"\s")
+
 
 def scan_for_secrets(text: str) -> list[SecretMatch]:
     """
@@ -51,8 +55,8 @@ def scan_for_secrets(text: str) -> list[SecretMatch]:
     """
     matches: list[SecretMatch] = []
 
-    for pattern_name, pattern in SECRET_PATTERNS:
-        for match in re.finditer(pattern, text):
+    for pattern_name, pattern in _COMPILED_PATTERNS:
+        for match in pattern.finditer(text):
             matches.append(
                 SecretMatch(
                     pattern_name=pattern_name,
@@ -93,8 +97,8 @@ def is_likely_secret(value: str) -> bool:
     Used for extra caution with unknown values.
     """
     # Check against all patterns
-    for _, pattern in SECRET_PATTERNS:
-        if re.search(pattern, value):
+    for _, pattern in _COMPILED_PATTERNS:
+        if pattern.search(value):
             return True
 
     # Additional heuristics
@@ -103,7 +107,7 @@ def is_likely_secret(value: str) -> bool:
         unique_chars = len(set(value))
         if unique_chars / len(value) > 0.7:
             # Check it's not just a sentence
-            if not re.search(r"\s", value):
+            if not _WHITESPACE_RE.search(value):
                 return True
 
     return False
@@ -1107,6 +1107,32 @@ def _ensure_static_permissions(static_dir: Path) -> None:
         print(f"  Fixed {fixed} static asset permissions")
 
 
+# Waiting for a killed port holder: poll quickly at first, backing off
+PORT_RELEASE_TIMEOUT = 2.0
+PORT_RELEASE_POLL_MIN = 0.005
+PORT_RELEASE_POLL_MAX = 0.1
+
+
+def _wait_for_exit(pids: list[int], timeout: float = PORT_RELEASE_TIMEOUT) -> None:
+    """Wait until every process in ``pids`` has exited, or ``timeout`` passes."""
+    deadline = time.monotonic() + timeout
+    delay = PORT_RELEASE_POLL_MIN
+    while pids and time.monotonic() < deadline:
+        alive = []
+        for pid in pids:
+            try:
+                os.kill(pid, 0)
+                alive.append(pid)
+            except ProcessLookupError:
+                pass
+            except PermissionError:
+                alive.append(pid)  # Exists but owned by someone else
+        pids = alive
+        if pids:
+            time.sleep(delay)
+            delay = min(delay * 1.5, PORT_RELEASE_POLL_MAX)
+
+
 def _kill_port_process(port: int) -> None:
     """Kill any existing process using the given port."""
     import platform
@@ -1120,14 +1146,14 @@ def _kill_port_process(port: int) -> None:
                 text=True,
             )
             if result.returncode == 0 and result.stdout.strip():
-                pids = result.stdout.strip().split("\n")
-                for pid in pids:
-                    if pid:
-                        try:
-                            os.kill(int(pid), signal.SIGTERM)
-                            time.sleep(0.1)  # Brief wait for cleanup
-                        except (ProcessLookupError, ValueError):
-                            pass
+                signalled = []
+                for pid in result.stdout.split():
+                    try:
+                        os.kill(int(pid), signal.SIGTERM)
+                        signalled.append(int(pid))
+                    except (ProcessLookupError, ValueError):
+                        pass
+                _wait_for_exit(signalled)
         elif platform.system() == "Windows":
             # Windows: use netstat and taskkill
             result = subprocess.run(
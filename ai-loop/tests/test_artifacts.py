@@ -0,0 +1,205 @@
+"""Tests for artifact management."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from ai_loop.core.artifacts import ArtifactManager
+from ai_loop.core.models import LinearIssue, RunContext
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ArtifactManager(tmp_path / "artifacts")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def ctx(manager, tmp_path):
+    issue = LinearIssue(
+        id="issue-123",
+        identifier="LIN-123",
+        title="Add user authentication flow",
+        description="Implement login",
+        state="Todo",
+        priority=2,
+        team_id="team-456",
+        team_name="Engineering",
+    )
+    run_id = "lin-123-20250101-000000-abcdef"
+    return RunContext(
+        run_id=run_id,
+        issue=issue,
+        repo_root=tmp_path,
+        artifacts_dir=manager.get_run_dir(run_id),
+    )
+
+
+class TestTrace:
+    """Tests for trace logging."""
+
+    def test_events_visible_before_close(self, manager, ctx):
+        """Trace lines must reach disk per event so the web UI can tail them."""
+        manager.log_event(ctx, "pipeline_started", {"issue": "LIN-123"})
+
+        lines = (ctx.artifacts_dir / "trace.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["event_type"] == "pipeline_started"
+
+    def test_reuses_handle_across_events(self, manager, ctx):
+        manager.log_event(ctx, "one")
+        handle = manager._trace_handles[ctx.artifacts_dir / "trace.jsonl"]
+        manager.log_event(ctx, "two")
+        assert manager._trace_handles[ctx.artifacts_dir / "trace.jsonl"] is handle
+
+    def test_close_trace_then_reopen(self, manager, ctx):
+        manager.log_event(ctx, "one")
+        manager.close_trace(ctx)
+        assert not manager._trace_handles
+        manager.log_event(ctx, "two")
+
+        events = manager.read_trace(ctx.run_id)
+        assert [e.event_type for e in events] == ["one", "two"]
+
+    def test_read_trace_skips_blank_and_malformed_lines(self, manager, ctx):
+        manager.log_event(ctx, "one")
+        with open(ctx.artifacts_dir / "trace.jsonl", "a") as f:
+            f.write("\n   \nnot json\n{\"truncated\": \n{}\n")
+        manager.log_event(ctx, "two")
+
+        events = manager.read_trace(ctx.run_id)
+        assert [e.event_type for e in events] == ["one", "two"]
+
+
+class TestMsgpackTrace:
+    """Tests for the length-prefixed msgpack trace format."""
+
+    @pytest.fixture
+    def msgpack_manager(self, tmp_path):
+        pytest.importorskip("msgpack")
+        manager = ArtifactManager(tmp_path / "artifacts", trace_format="msgpack")
+        yield manager
+        manager.close()
+
+    def test_round_trip(self, msgpack_manager, ctx):
+        msgpack_manager.log_event(ctx, "pipeline_started", {"issue": "LIN-123"})
+        msgpack_manager.log_event(ctx, "pipeline_completed")
+
+        assert (ctx.artifacts_dir / "trace.msgpack").exists()
+        assert not (ctx.artifacts_dir / "trace.jsonl").exists()
+        events = msgpack_manager.read_trace(ctx.run_id)
+        assert [e.event_type for e in events] == ["pipeline_started", "pipeline_completed"]
+        assert events[0].data == {"issue": "LIN-123"}
+
+    def test_jsonl_manager_reads_msgpack_run(self, msgpack_manager, manager, ctx):
+        msgpack_manager.log_event(ctx, "pipeline_started")
+        assert [e.event_type for e in manager.read_trace(ctx.run_id)] == ["pipeline_started"]
+
+    def test_stops_at_partial_frame(self, msgpack_manager, ctx):
+        msgpack_manager.log_event(ctx, "one")
+        with open(ctx.artifacts_dir / "trace.msgpack", "ab") as f:
+            f.write(b"\x40\x00\x00\x00\x84")  # Header promises 64 bytes
+
+        assert [e.event_type for e in msgpack_manager.read_trace(ctx.run_id)] == ["one"]
+
+
+class TestTraceFlusher:
+    """Tests for batched trace writes."""
+
+    @pytest.mark.asyncio
+    async def test_flusher_batches_and_drains_on_stop(self, manager, ctx):
+        manager.start_flusher()
+        for i in range(5):
+            manager.log_event(ctx, f"event_{i}")
+
+        # Queued, not yet written
+        assert manager.read_trace(ctx.run_id) == []
+
+        await manager.stop_flusher()
+        events = manager.read_trace(ctx.run_id)
+        assert [e.event_type for e in events] == [f"event_{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_flusher_writes_in_background(self, manager, ctx):
+        manager.start_flusher()
+        manager.log_event(ctx, "pipeline_started")
+        await asyncio.sleep(0.2)
+
+        assert [e.event_type for e in manager.read_trace(ctx.run_id)] == ["pipeline_started"]
+        await manager.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_events_serialized_by_flusher(self, manager, ctx):
+        manager.start_flusher()
+        with patch.object(manager, "_encode_event", wraps=manager._encode_event) as encode:
+            manager.log_event(ctx, "pipeline_started")
+            encode.assert_not_called()
+            await manager.stop_flusher()
+        encode.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_trace_flushes_pending(self, manager, ctx):
+        manager.start_flusher()
+        manager.log_event(ctx, "pipeline_completed")
+        manager.close_trace(ctx)
+
+        assert [e.event_type for e in manager.read_trace(ctx.run_id)] == ["pipeline_completed"]
+        await manager.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_close_trace_keeps_order_of_event_held_by_flusher(self, manager, ctx):
+        manager.start_flusher()
+        manager.log_event(ctx, "pipeline_error")
+        await asyncio.sleep(0.01)  # Flusher has taken it and is waiting
+        manager.log_event(ctx, "pipeline_completed")
+        manager.close_trace(ctx)
+        await manager.stop_flusher()
+
+        events = manager.read_trace(ctx.run_id)
+        assert [e.event_type for e in events] == ["pipeline_error", "pipeline_completed"]
+        assert not manager._trace_handles
+
+
+class TestWrites:
+    """Tests for artifact file writes."""
+
+    def test_write_plan_redacts_secrets(self, manager, ctx):
+        content = "Use key lin_api_" + "a" * 40 + " for auth"
+        path = manager.write_plan(ctx, 1, content)
+        manager.write_plan(ctx, 2, content)  # Memoized path
+
+        for version in (1, 2):
+            text = (ctx.artifacts_dir / f"plan_v{version}.md").read_text()
+            assert "[REDACTED:linear_api_key]" in text
+            assert "lin_api_aaaa" not in text
+        assert path.name == "plan_v1.md"
+
+
+class TestSummaries:
+    """Tests for run summaries."""
+
+    def test_write_summary_round_trips_through_list_runs(self, manager, ctx):
+        from datetime import datetime
+
+        from ai_loop.core.models import RunStatus
+
+        ctx.status = RunStatus.SUCCESS
+        ctx.current_iteration = 2
+        ctx.branch_name = "agent/lin-123"
+        ctx.started_at = datetime(2025, 1, 1, 10, 0, 0)
+        ctx.completed_at = datetime(2025, 1, 1, 10, 5, 0)
+        path = manager.write_summary(ctx)
+
+        assert json.loads(path.read_text())["status"] == "success"
+        [summary] = manager.list_runs()
+        assert summary.run_id == ctx.run_id
+        assert summary.status == RunStatus.SUCCESS
+        assert summary.iterations == 2
+        assert summary.completed_at == ctx.completed_at
+
+    def test_list_runs_skips_corrupt_summary(self, manager, ctx):
+        (ctx.artifacts_dir / "summary.json").write_text("{not json")
+        assert manager.list_runs() == []
@@ -0,0 +1,137 @@
+"""Tests for the Claude CLI runner."""
+
+import os
+import sys
+
+import pytest
+
+from ai_loop.integrations.claude_runner import ClaudeRunner
+
+
+@pytest.fixture
+def runner(tmp_path):
+    # Stand-in CLI: echoes its stdin prompt upper-cased, with its pid.
+    # "hang:<path>" starts a child (pid written to <path>) and never returns.
+    script = tmp_path / "fake_claude.py"
+    script.write_text(
+        "import os, subprocess, sys, time\n"
+        "prompt = sys.stdin.read()\n"
+        "if prompt.startswith('hang:'):\n"
+        "    quiet = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL}\n"
+        "    child = subprocess.Popen(['sleep', '30'], **quiet)\n"
+        "    with open(prompt[5:], 'w') as f:\n"
+        "        f.write(str(child.pid))\n"
+        "    time.sleep(30)\n"
+        "sys.stdout.write(f'{os.getpid()}:' + prompt.upper())\n"
+    )
+    wrapper = tmp_path / "claude"
+    wrapper.write_text(f'#!/bin/sh\nexec {sys.executable} {script} "$@"\n')
+    wrapper.chmod(0o755)
+    return ClaudeRunner(cmd=str(wrapper))
+
+
+class TestRunClaude:
+    """Tests for _run_claude."""
+
+    @pytest.mark.asyncio
+    async def test_prompt_sent_on_stdin(self, runner, tmp_path):
+        stdout, _ = await runner._run_claude("make a plan", cwd=tmp_path)
+        assert stdout.endswith(":MAKE A PLAN")
+        await runner.close()
+
+    @pytest.mark.asyncio
+    async def test_next_call_uses_prestarted_process(self, runner, tmp_path):
+        await runner._run_claude("one", cwd=tmp_path, prestart=True)
+        spare, _ = runner._spares[tmp_path]
+
+        stdout, _ = await runner._run_claude("two", cwd=tmp_path, prestart=True)
+        assert stdout == f"{spare.pid}:TWO"
+        assert runner._spares[tmp_path][0] is not spare
+
+        await runner.close()
+        assert not runner._spares
+
+    @pytest.mark.asyncio
+    async def test_no_spare_unless_requested(self, runner, tmp_path):
+        await runner._run_claude("last call", cwd=tmp_path)
+        assert not runner._spares
+
+    @pytest.mark.asyncio
+    async def test_discard_stops_spare_for_one_dir(self, runner, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+        await runner._run_claude("one", cwd=tmp_path, prestart=True)
+        await runner._run_claude("one", cwd=other, prestart=True)
+        spare, _ = runner._spares[tmp_path]
+
+        await runner.discard(tmp_path)
+        assert spare.returncode is not None
+        assert list(runner._spares) == [other]
+        await runner.discard(tmp_path)  # Nothing left: no-op
+        await runner.close()
+
+    @pytest.mark.asyncio
+    async def test_dead_spare_replaced(self, runner, tmp_path):
+        await runner._run_claude("one", cwd=tmp_path, prestart=True)
+        spare, _ = runner._spares[tmp_path]
+        spare.kill()
+        await spare.wait()
+
+        stdout, _ = await runner._run_claude("two", cwd=tmp_path)
+        assert stdout.endswith(":TWO")
+        assert not stdout.startswith(f"{spare.pid}:")
+        await runner.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_spare_replaced(self, runner, tmp_path, monkeypatch):
+        await runner._run_claude("one", cwd=tmp_path, prestart=True)
+        spare, _ = runner._spares[tmp_path]
+        monkeypatch.setattr("ai_loop.integrations.claude_runner.SPARE_MAX_IDLE", 0)
+
+        stdout, _ = await runner._run_claude("two", cwd=tmp_path)
+        assert not stdout.startswith(f"{spare.pid}:")
+        assert spare.returncode is not None
+        await runner.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process_group(self, runner, tmp_path):
+        pid_file = tmp_path / "child.pid"
+        with pytest.raises(TimeoutError):
+            await runner._run_claude(f"hang:{pid_file}", cwd=tmp_path, timeout=1)
+
+        child = int(pid_file.read_text())
+        try:
+            assert not _running(child)
+        finally:
+            if _running(child):
+                os.kill(child, 9)
+            await runner.close()
+
+    @pytest.mark.asyncio
+    async def test_stops_cli_without_killpg(self, runner, tmp_path, monkeypatch):
+        """Windows has no os.killpg; the CLI itself is still stopped."""
+        monkeypatch.delattr("ai_loop.integrations.claude_runner.os.killpg")
+        pid_file = tmp_path / "child.pid"
+        with pytest.raises(TimeoutError):
+            await runner._run_claude(f"hang:{pid_file}", cwd=tmp_path, timeout=1)
+        os.kill(int(pid_file.read_text()), 9)  # Not reachable without a group kill
+
+        await runner._run_claude("one", cwd=tmp_path, prestart=True)
+        spare, _ = runner._spares[tmp_path]
+        await runner.close()
+        assert spare.returncode is not None
+
+
+def _running(pid: int) -> bool:
+    """Whether pid is a live (not zombie) process."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+    except OSError:  # pragma: no cover - no procfs
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
@@ -2,6 +2,8 @@
 
 import asyncio
 import signal
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -128,3 +130,108 @@ class TestGracefulSigint:
                 if interrupted:
                     pass  # Would handle gracefully
                 raise  # Re-raise since not from our interrupt
+
+
+class TestSignalHandlerInstall:
+    """Tests for _install_signal_handlers."""
+
+    @pytest.mark.asyncio
+    async def test_installs_sigint_and_sigterm_on_loop(self):
+        from ai_loop.cli import _install_signal_handlers
+
+        loop = asyncio.get_running_loop()
+        calls = []
+        remove = _install_signal_handlers(loop, lambda: calls.append(True))
+        try:
+            handler = loop._signal_handlers[signal.SIGTERM]
+            handler._run()
+            assert calls == [True]
+            assert signal.SIGINT in loop._signal_handlers
+        finally:
+            remove()
+
+        assert signal.SIGTERM not in loop._signal_handlers
+
+    def test_falls_back_to_signal_signal_when_unsupported(self):
+        """Windows loops raise NotImplementedError from add_signal_handler."""
+        from ai_loop.cli import _SHUTDOWN_SIGNALS, _install_signal_handlers
+
+        loop = MagicMock()
+        loop.add_signal_handler.side_effect = NotImplementedError
+        handler = MagicMock()
+
+        with patch("ai_loop.cli.signal.signal", return_value="previous") as mock_signal:
+            remove = _install_signal_handlers(loop, handler)
+            assert mock_signal.call_count == len(_SHUTDOWN_SIGNALS)
+
+            # Raw handler hops back onto the loop thread-safely
+            sig, raw_handler = mock_signal.call_args_list[0].args
+            raw_handler(sig, None)
+            loop.call_soon_threadsafe.assert_called_once_with(handler)
+
+            remove()
+            mock_signal.assert_called_with(_SHUTDOWN_SIGNALS[-1], "previous")
+            loop.remove_signal_handler.assert_not_called()
+
+
+class TestTruncate:
+    """Tests for _truncate."""
+
+    def test_short_text_unchanged(self):
+        from ai_loop.cli import _truncate
+
+        assert _truncate("agent/lin-123") == "agent/lin-123"
+        assert _truncate("x" * 30) == "x" * 30
+
+    def test_long_text_cut_with_ellipsis(self):
+        from ai_loop.cli import _truncate
+
+        assert _truncate("x" * 31) == "x" * 30 + "..."
+        assert _truncate("abcdef", width=3) == "abc..."
+
+
+class TestArtifactsManager:
+    """Tests for _artifacts_manager."""
+
+    def test_repo_root_and_manager_cached(self, tmp_path, monkeypatch):
+        from ai_loop.cli import _artifacts_manager
+        from ai_loop.integrations.git_tools import _repo_root_for
+
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        monkeypatch.chdir(tmp_path)
+        _repo_root_for.cache_clear()
+
+        with patch(
+            "ai_loop.integrations.git_tools.subprocess.run", wraps=subprocess.run
+        ) as mock_run:
+            manager = _artifacts_manager()
+            assert _artifacts_manager() is manager
+        assert mock_run.call_count == 1
+        assert manager.artifacts_root == tmp_path.resolve() / "artifacts"
+
+
+class TestRunAsync:
+    """Tests for _run_async."""
+
+    def test_runs_without_uvloop(self, monkeypatch):
+        from ai_loop.cli import _run_async
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        async def answer():
+            return 42
+
+        assert _run_async(answer()) == 42
+
+    def test_uses_uvloop_loop_factory(self, monkeypatch):
+        from ai_loop.cli import _run_async
+
+        fake_uvloop = MagicMock()
+        fake_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+
+        async def answer():
+            return 42
+
+        assert _run_async(answer()) == 42
+        fake_uvloop.new_event_loop.assert_called_once()
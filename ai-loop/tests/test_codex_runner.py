@@ -9,6 +9,7 @@ import pytest
 from ai_loop.integrations.codex_runner import (
     CodexRunner,
     _CODEX_CAPS_CACHE,
+    _CODEX_CAPS_PROBES,
     _DETECTION_TIMEOUT,
 )
 
@@ -17,8 +18,10 @@ from ai_loop.integrations.codex_runner import (
 def clear_caps_cache():
     """Clear the module-level cache before each test."""
     _CODEX_CAPS_CACHE.clear()
+    _CODEX_CAPS_PROBES.clear()
     yield
     _CODEX_CAPS_CACHE.clear()
+    _CODEX_CAPS_PROBES.clear()
 
 
 class TestCodexCapabilityDetection:
@@ -138,6 +141,33 @@ class TestCodexCapabilityDetection:
         assert mock_exec2.call_count == 0
         assert caps2 == caps1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_probe(self):
+        """Gates starting together should wait on a single --help run."""
+        release = asyncio.Event()
+
+        async def communicate():
+            await release.wait()
+            return b"  --full-auto\n", b""
+
+        mock_proc = MagicMock()
+        mock_proc.communicate = communicate
+
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_proc)) as mock_exec:
+            callers = [
+                asyncio.create_task(CodexRunner(cmd="codex")._detect_codex_capabilities())
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            callers[0].cancel()
+            release.set()
+            results = await asyncio.gather(*callers[1:])
+
+        assert mock_exec.call_count == 1
+        assert all(caps["full_auto"] for caps in results)
+        assert _CODEX_CAPS_CACHE["codex"] == results[0]
+        assert not _CODEX_CAPS_PROBES
+
 
 class TestCodexArgBuilder:
     """Tests for _build_codex_args."""
@@ -287,3 +317,79 @@ class TestCodexArgBuilder:
         assert "-q" not in args
         assert "--output-schema" in args
         assert "-o" in args
+
+    @pytest.mark.asyncio
+    async def test_flags_built_once_per_runner(self):
+        """Later calls reuse the capability-dependent prefix."""
+        runner = CodexRunner(cmd="codex")
+        _CODEX_CAPS_CACHE["codex"] = dict.fromkeys(
+            ["approval_mode", "full_auto", "json", "output_schema", "quiet"], False
+        )
+
+        detect_spy = patch.object(
+            runner, "_detect_codex_capabilities", wraps=runner._detect_codex_capabilities
+        )
+        with detect_spy as detect:
+            first = await runner._build_codex_args(Path("/s.json"), Path("/v1.json"), "one")
+            second = await runner._build_codex_args(Path("/s.json"), Path("/v2.json"), "two")
+
+        assert detect.await_count == 1
+        assert first == ["codex", "exec", "--output-schema", "/s.json", "-o", "/v1.json", "one"]
+        assert second[-3:] == ["-o", "/v2.json", "two"]
+
+
+class TestRunCodexExec:
+    """Tests for running codex exec."""
+
+    @pytest.mark.asyncio
+    async def test_error_keeps_stderr_tail(self, tmp_path):
+        import sys
+
+        from ai_loop.integrations import codex_runner
+
+        # Stand-in CLI: floods stdout and stderr, then fails
+        script = tmp_path / "fake_codex.py"
+        script.write_text(
+            "import sys\n"
+            "sys.stdout.write('o' * 1_000_000)\n"
+            "sys.stderr.write('x' * 200_000 + 'fatal: boom')\n"
+            "sys.exit(2)\n"
+        )
+        wrapper = tmp_path / "codex"
+        wrapper.write_text(f'#!/bin/sh\nexec {sys.executable} {script}\n')
+        wrapper.chmod(0o755)
+        _CODEX_CAPS_CACHE[str(wrapper)] = dict.fromkeys(
+            ["approval_mode", "full_auto", "json", "output_schema", "quiet"], False
+        )
+
+        runner = CodexRunner(cmd=str(wrapper))
+        with pytest.raises(RuntimeError, match="code 2") as exc_info:
+            await runner._run_codex_exec("prompt", tmp_path, tmp_path / "out.json", timeout=30)
+
+        message = str(exc_info.value)
+        assert message.endswith("fatal: boom")
+        assert len(message) < codex_runner.CODEX_STDERR_TAIL + 100
+
+
+class TestCritiqueParsing:
+    """Tests for _parse_critique_output."""
+
+    def test_parses_critique_json(self, tmp_path):
+        output_path = tmp_path / "plan_gate_v1.json"
+        output_path.write_text(
+            '{"approved": true, "confidence": 97, "blockers": [], "warnings": ["nit"]}'
+        )
+
+        result = CodexRunner(cmd="codex")._parse_critique_output(output_path)
+        assert result.approved
+        assert result.confidence == 97
+        assert result.warnings == ["nit"]
+
+    def test_rejects_malformed_output(self, tmp_path):
+        from pydantic import ValidationError
+
+        output_path = tmp_path / "plan_gate_v1.json"
+        output_path.write_text('{"approved": true, "confidence": ')
+
+        with pytest.raises(ValidationError):
+            CodexRunner(cmd="codex")._parse_critique_output(output_path)
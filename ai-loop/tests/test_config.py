@@ -0,0 +1,73 @@
+"""Tests for settings loading and caching."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ai_loop.config import (
+    get_prompts_dir,
+    get_schemas_dir,
+    get_settings,
+    load_prompt,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Reset the cached settings around each test."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class TestGetSettings:
+    """Tests for get_settings caching."""
+
+    def test_returns_same_instance(self, monkeypatch):
+        monkeypatch.setenv("LINEAR_API_KEY", "lin_api_test")
+        assert get_settings() is get_settings()
+
+    def test_cache_clear_reloads_environment(self, monkeypatch):
+        monkeypatch.setenv("LINEAR_API_KEY", "lin_api_test")
+        monkeypatch.setenv("CLAUDE_CMD", "claude-a")
+        assert get_settings().claude_cmd == "claude-a"
+
+        monkeypatch.setenv("CLAUDE_CMD", "claude-b")
+        assert get_settings().claude_cmd == "claude-a"  # Still cached
+
+        get_settings.cache_clear()
+        assert get_settings().claude_cmd == "claude-b"
+
+
+class TestResourceDirs:
+    """Tests for bundled resource directory lookup."""
+
+    def test_prompts_dir_exists(self):
+        assert get_prompts_dir().is_dir()
+        assert get_prompts_dir() is get_prompts_dir()
+
+    def test_schemas_dir_contains_critique_schema(self):
+        assert (get_schemas_dir() / "critique_schema.json").exists()
+
+
+class TestLoadPrompt:
+    """Tests for prompt template loading."""
+
+    def test_cached_until_file_changes(self, tmp_path):
+        path = tmp_path / "planner.md"
+        path.write_text("v1")
+        assert load_prompt(tmp_path, "planner") == "v1"
+
+        with patch("pathlib.Path.read_text") as read_text:
+            assert load_prompt(tmp_path, "planner") == "v1"
+        read_text.assert_not_called()
+
+        path.write_text("v2")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_prompt(tmp_path, "planner") == "v2"
+
+    def test_missing_prompt(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="Prompt not found"):
+            load_prompt(tmp_path, "missing")
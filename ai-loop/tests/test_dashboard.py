@@ -0,0 +1,292 @@
+"""Tests for terminal dashboards."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from ai_loop.core.dashboard import RENDER_INTERVAL, Dashboard, SimpleDashboard
+
+
+class TestIssueProgress:
+    """Tests for per-issue progress."""
+
+    def test_elapsed_reuses_string_within_a_second(self):
+        from ai_loop.core.dashboard import IssueProgress
+
+        progress = IssueProgress("LIN-1", "First", started_monotonic=1000.0)
+        first = progress.elapsed(1065.1)
+        assert first == "01:05"
+        assert progress.elapsed(1065.9) is first
+        assert progress.elapsed(1066.0) == "01:06"
+
+    def test_last_event_truncated_on_update(self):
+        from ai_loop.core.dashboard import LAST_EVENT_MAX_LEN, BatchProgress
+
+        batch = BatchProgress()
+        batch.add_issue("LIN-1", "First")
+        batch.update("LIN-1", last_event="x" * 1000)
+        assert batch.issues["LIN-1"].last_event == "x" * LAST_EVENT_MAX_LEN
+
+    def test_update_reports_changes_and_counts_once(self):
+        from ai_loop.core.dashboard import BatchProgress
+
+        batch = BatchProgress()
+        batch.add_issue("LIN-1", "First")
+        assert batch.update("LIN-1", status="success", confidence=98)
+        assert not batch.update("LIN-1", status="success", confidence=98)
+        assert batch.completed == 1
+        assert not batch.update("LIN-404", status="failed")
+
+    def test_update_records_start_time(self):
+        from ai_loop.core.dashboard import BatchProgress
+
+        batch = BatchProgress()
+        batch.add_issue("LIN-1", "First")
+        batch.update("LIN-1", status="planning")
+        assert batch.issues["LIN-1"].started_monotonic is not None
+        assert batch.issues["LIN-1"].elapsed() == "00:00"
+
+    def test_elapsed_before_start(self):
+        from ai_loop.core.dashboard import IssueProgress
+
+        assert IssueProgress("LIN-1", "First").elapsed() == "-"
+
+
+class TestSimpleDashboardTicker:
+    """Tests for the elapsed-time refresh timer."""
+
+    @pytest.mark.asyncio
+    async def test_tick_scheduled_only_while_stage_active(self):
+        dashboard = SimpleDashboard(issue_id="LIN-123")
+        dashboard.start_stage("planning", "Generating plan")
+        assert dashboard._tick_handle is not None
+
+        with patch.object(dashboard, "update_stage") as update_stage:
+            dashboard._tick()
+        update_stage.assert_called_once()
+        assert dashboard._tick_handle is not None  # Rescheduled
+
+        dashboard.stop_stage()
+        assert dashboard._tick_handle is None
+
+    def test_no_tick_without_event_loop(self):
+        dashboard = SimpleDashboard()
+        dashboard.start_stage("planning", "Generating plan")
+        assert dashboard._tick_handle is None
+        dashboard.stop_stage()
+
+
+class TestDashboardContextManager:
+    """Tests for running the batch dashboard as an async context manager."""
+
+    @pytest.mark.asyncio
+    async def test_clean_exit_waits_for_final_frame(self):
+        dashboard = Dashboard()
+        dashboard.add_issues([("LIN-1", "First")])
+
+        with patch.object(Dashboard, "_build_table", wraps=dashboard._build_table) as build:
+            async with dashboard:
+                task = dashboard._task
+                await asyncio.sleep(0)
+                dashboard.update("LIN-1", status="success")
+        assert task.done() and not task.cancelled()
+        assert build.call_count >= 2  # Initial frame plus the final one
+        assert dashboard._task is None
+
+    @pytest.mark.asyncio
+    async def test_clean_exit_finishes_with_unfinished_issues(self):
+        """Issues that end "stuck" never count as done; exit must not hang."""
+        dashboard = Dashboard()
+        dashboard.add_issues([("LIN-1", "First")])
+
+        async with dashboard:
+            task = dashboard._task
+            dashboard.update("LIN-1", status="stuck")
+        assert task.done() and not task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_render_task(self):
+        dashboard = Dashboard()
+        dashboard.add_issues([("LIN-1", "First")])
+
+        with pytest.raises(RuntimeError):
+            async with dashboard:
+                task = dashboard._task
+                raise RuntimeError("boom")
+        assert task.cancelled()
+
+
+class TestDashboardRows:
+    """Tests for incremental row rendering."""
+
+    def test_only_dirty_rows_rerendered(self):
+        dashboard = Dashboard()
+        dashboard.add_issues([("LIN-1", "First"), ("LIN-2", "Second")])
+        dashboard._build_table()
+
+        dashboard.update("LIN-2", status="planning", last_event="Starting...")
+        with patch.object(Dashboard, "_render_row", wraps=Dashboard._render_row) as render:
+            table = dashboard._build_table()
+        assert [c.args[0].issue_identifier for c in render.call_args_list] == ["LIN-2"]
+        assert table.row_count == 3  # Two issues plus the summary row
+        assert dashboard._cells["LIN-2"][7] == "Starting..."
+
+        with patch.object(Dashboard, "_render_row") as render:
+            dashboard._build_table()
+        render.assert_not_called()
+
+    def test_no_op_update_does_not_wake_renderer(self):
+        dashboard = Dashboard()
+        dashboard.add_issues([("LIN-1", "First")])
+        dashboard.update("LIN-1", status="planning")
+        dashboard._update_event.clear()
+        dashboard._dirty.clear()
+
+        dashboard.update("LIN-1", status="planning")
+        assert not dashboard._update_event.is_set()
+        assert not dashboard._dirty
+
+    def test_row_styles(self):
+        from ai_loop.core.dashboard import IssueProgress
+
+        progress = IssueProgress("LIN-1", "First", status="stuck", confidence=85, blockers=2)
+        cells = Dashboard._render_row(progress)
+        assert str(cells[2].style) == "bold yellow"
+        assert cells[4] == "[yellow]85[/yellow]"
+        assert cells[5] == "[red]2[/red]"
+
+        progress = IssueProgress("LIN-2", "Second", status="planning", confidence=97)
+        cells = Dashboard._render_row(progress)
+        assert str(cells[2].style) == "cyan"
+        assert cells[4] == "[green]97[/green]"
+        assert cells[5] == "-"
+
+    def test_summary_reflects_counts(self):
+        dashboard = Dashboard()
+        dashboard.add_issues([("LIN-1", "First")])
+        dashboard._build_table()
+
+        cells = dashboard._summary_cells
+
+        dashboard.update("LIN-1", last_event="still going")
+        dashboard._build_table()
+        assert dashboard._summary_cells is cells  # Counters unchanged: reused
+
+        dashboard.update("LIN-1", status="success")
+        dashboard._build_table()
+        assert "Done: 1" in dashboard._summary_cells[2]
+
+
+class TestDashboardRender:
+    """Tests for the render loop."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_updates_coalesces_into_one_rebuild(self):
+        dashboard = Dashboard()
+        dashboard.add_issues([("LIN-1", "First")])
+
+        with patch.object(Dashboard, "_build_table", wraps=dashboard._build_table) as build:
+            task = asyncio.create_task(dashboard.run())
+            await asyncio.sleep(0)
+            initial = build.call_count
+
+            for i in range(50):
+                dashboard.update("LIN-1", status="planning", last_event=f"event_{i}")
+                await asyncio.sleep(0)
+            await asyncio.sleep(RENDER_INTERVAL * 1.5)
+
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            dashboard.stop()
+
+        assert build.call_count - initial <= 2
+
+    @pytest.mark.asyncio
+    async def test_idle_loop_waits_without_timeouts(self):
+        dashboard = Dashboard()
+        dashboard.add_issues([("LIN-1", "First")])
+
+        with patch("ai_loop.core.dashboard.asyncio.wait_for") as wait_for:
+            task = asyncio.create_task(dashboard.run())
+            await asyncio.sleep(0)
+            assert dashboard._tick_handle is not None
+
+            dashboard._tick_handle.cancel()
+            dashboard._tick()  # Fire the elapsed tick by hand
+            assert dashboard._update_event.is_set()
+
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            dashboard.stop()
+
+        wait_for.assert_not_called()
+        assert dashboard._tick_handle is None
+
+
+class TestSimpleDashboardPrefix:
+    """Tests for stage prefixes."""
+
+    def test_batch_prefix_includes_issue(self):
+        dashboard = SimpleDashboard(issue_id="LIN-123", batch_mode=True)
+        assert dashboard._stage_prefix("planning") == "[LIN-123][PLAN]"
+        assert dashboard._stage_prefix("planning") is dashboard._stage_prefix("planning")
+
+    def test_unknown_stage_uppercased(self):
+        assert SimpleDashboard(issue_id="LIN-123")._stage_prefix("custom") == "[CUSTOM]"
+
+class TestSimpleDashboardEvents:
+    """Tests for event printing."""
+
+    def test_event_data_printed_verbatim(self):
+        from io import StringIO
+
+        from rich.console import Console
+
+        dashboard = SimpleDashboard()
+        dashboard.console = Console(file=StringIO(), width=200)
+        dashboard.event("plan_gate_failed", {"blockers": ["[bold]missing tests[/bold]"]})
+        dashboard.key_event("pipeline_error", {"error": "bad [red] tag"})
+
+        output = dashboard.console.file.getvalue()
+        assert "[bold]missing tests[/bold]" in output
+        assert "→ Error: bad [red] tag" in output
+
+    def test_show_failure_single_write(self):
+        from io import StringIO
+
+        from rich.console import Console
+
+        dashboard = SimpleDashboard()
+        dashboard.console = Console(file=StringIO(), width=200)
+        with patch.object(dashboard.console, "print", wraps=dashboard.console.print) as print_:
+            dashboard.show_failure("planning", 2, "bad [red] input", "artifacts/run-1")
+        print_.assert_called_once()
+
+        assert dashboard.console.file.getvalue().splitlines() == [
+            "",
+            "✗ Pipeline failed at PLANNING",
+            "",
+            "  Exit code: 2",
+            "  Error: bad [red] input",
+            "",
+            "  Artifacts: artifacts/run-1",
+            "  Logs: artifacts/run-1/trace.jsonl",
+            "",
+            "  Next: re-run with --verbose and inspect trace.jsonl",
+        ]
+
+
+def test_dashboards_share_console():
+    from ai_loop.core.console import get_console
+
+    assert Dashboard().console is SimpleDashboard().console is get_console()
+
+
+def test_stage_elapsed_uses_monotonic_clock():
+    dashboard = SimpleDashboard()
+    assert dashboard._format_elapsed() == "0:00"
+    with patch("ai_loop.core.dashboard.time.monotonic", side_effect=[100.0, 100.0, 165.5]):
+        dashboard.start_stage("planning", "Generating plan")
+        assert dashboard._format_elapsed() == "1:05"
+    dashboard.stop_stage()
@@ -0,0 +1,152 @@
+"""Tests for git helpers."""
+
+import subprocess
+
+import pytest
+
+from ai_loop.integrations.git_tools import GitTools
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-b", "main")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.txt").write_text("one\n")
+    _git(tmp_path, "add", "a.txt")
+    _git(tmp_path, "commit", "-m", "initial")
+    _git(tmp_path, "checkout", "-b", "agent/lin-1")
+    return tmp_path
+
+
+class TestGetDiff:
+    """Tests for get_diff."""
+
+    @pytest.mark.asyncio
+    async def test_diff_against_given_base(self, repo):
+        git = GitTools(repo)
+        (repo / "a.txt").write_text("two\n")
+        _git(repo, "commit", "-am", "change")
+        base = await git.get_merge_base(repo)
+        assert "+two" in await git.get_diff(repo)
+
+        (repo / "a.txt").write_text("three\n")
+        _git(repo, "commit", "-am", "fix")
+        calls = []
+        original = git._run_git_async
+
+        async def spy(*args, cwd=None):
+            calls.append(args[0])
+            return await original(*args, cwd=cwd)
+
+        git._run_git_async = spy
+        diff = await git.get_diff(repo, base)
+        assert "+three" in diff and "-one" in diff  # Still against main
+        assert calls == ["diff"]
+
+    @pytest.mark.asyncio
+    async def test_merge_base_follows_branch(self, repo):
+        git = GitTools(repo)
+        first = await git.get_merge_base(repo)
+
+        _git(repo, "checkout", "main")
+        (repo / "a.txt").write_text("main moved\n")
+        _git(repo, "commit", "-am", "main change")
+        _git(repo, "checkout", "-b", "agent/lin-2")
+        assert await git.get_merge_base(repo) != first
+
+    @pytest.mark.asyncio
+    async def test_bounded_diff_keeps_whole_files(self, repo):
+        git = GitTools(repo)
+        (repo / "a.txt").write_text("two\n")
+        (repo / "b.txt").write_text("x\n" * 5000)
+        _git(repo, "add", "b.txt")
+        _git(repo, "commit", "-am", "change")
+
+        full = await git.get_diff(repo)
+        assert await git.get_diff_bounded(repo, max_chars=len(full)) == full
+
+        bounded = await git.get_diff_bounded(repo, max_chars=1000)
+        assert "+two" in bounded
+        assert "+x" not in bounded
+        assert bounded.endswith("files not shown: b.txt]")
+
+    def test_oversized_first_file_cut_at_line(self):
+        from ai_loop.integrations.git_tools import _truncate_diff
+
+        diff = "diff --git a/big.txt b/big.txt\n" + "+line\n" * 100
+        cut = _truncate_diff(diff, max_chars=100)
+        body, note = cut.rsplit("\n", 1)
+        assert len(body) <= 100 and body.endswith("+line")
+        assert note.startswith("[diff truncated: showing")
+        assert "files not shown" not in note
+
+
+class TestWorktreePool:
+    """Tests for reusable worktree slots."""
+
+    def test_slots_are_exclusive_until_released(self, repo, tmp_path):
+        from ai_loop.integrations.git_tools import WorktreePool
+
+        pool = WorktreePool(GitTools(repo), tmp_path / "pool", size=2)
+        first, second = pool.acquire(), pool.acquire()
+        assert first.name == "slot-0" and second.name == "slot-1"
+        assert pool.acquire() is None
+
+        pool.release(first)
+        pool.release(repo / "worktree")  # Not a pool slot: ignored
+        assert pool.acquire() == first
+
+    def test_slot_freed_when_owner_process_dies(self, repo, tmp_path):
+        import sys
+
+        from ai_loop.integrations.git_tools import WorktreePool
+
+        pool = WorktreePool(GitTools(repo), tmp_path / "pool", size=1)
+        owner = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys, time; from pathlib import Path;"
+                "from ai_loop.integrations.git_tools import WorktreePool;"
+                f"WorktreePool(None, Path({str(pool.root)!r}), 1).acquire();"
+                "print('locked', flush=True); time.sleep(30)",
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert owner.stdout.readline().strip() == "locked"
+            assert pool.acquire() is None  # Held by a live process
+        finally:
+            owner.kill()
+            owner.wait()
+            owner.stdout.close()
+
+        assert pool.acquire() == pool.root / "slot-0"
+
+    @pytest.mark.asyncio
+    async def test_reused_slot_is_reset_onto_new_branch(self, repo, tmp_path):
+        from ai_loop.integrations.git_tools import WorktreePool
+
+        git = GitTools(repo)
+        pool = WorktreePool(git, tmp_path / "pool", size=1)
+
+        slot = pool.acquire()
+        await pool.checkout(slot, "agent/lin-1-run")
+        (slot / "a.txt").write_text("edited\n")
+        (slot / "stray.txt").write_text("left over\n")
+        pool.release(slot)
+
+        assert pool.acquire() == slot
+        await pool.checkout(slot, "agent/lin-2-run")
+        assert (slot / "a.txt").read_text() == "one\n"
+        assert not (slot / "stray.txt").exists()
+        branch = subprocess.run(
+            ["git", "branch", "--show-current"], cwd=slot, capture_output=True, text=True
+        ).stdout.strip()
+        assert branch == "agent/lin-2-run"
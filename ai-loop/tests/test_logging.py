@@ -0,0 +1,107 @@
+"""Tests for terminal logging helpers."""
+
+import io
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ai_loop.core.console import get_console
+from ai_loop.core.logging import flush_logs, is_high_signal, log
+
+
+class TestIsHighSignal:
+    """Tests for is_high_signal."""
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "[12:00:00] [PIPELINE] Starting",
+            "[12:00:00] [PLAN_GATE] confidence=97",
+            "RuntimeError: boom (Exception raised)",
+            "Traceback (most recent call last):",
+            "3 tests FAILED",
+            "ERROR: something broke",
+        ],
+    )
+    def test_high_signal_lines(self, line):
+        assert is_high_signal(line)
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "",
+            "[12:00:00] [DEBUG] noise",
+            "PIPELINE without brackets",
+            "[pipeline] lowercase prefix",
+        ],
+    )
+    def test_low_signal_lines(self, line):
+        assert not is_high_signal(line)
+
+
+class TestLog:
+    """Tests for the queued stderr logger."""
+
+    def test_lines_reach_stderr_in_order_after_flush(self, capsys):
+        for i in range(100):
+            log("PIPELINE", f"message {i}")
+        flush_logs()
+
+        lines = capsys.readouterr().err.splitlines()
+        assert len(lines) == 100
+        assert lines[0].endswith("[PIPELINE] message 0")
+        assert lines[-1].endswith("[PIPELINE] message 99")
+        assert all(line.startswith("[") and line[9] == "]" for line in lines)
+
+    def test_timestamp_formatted_once_per_second(self, capsys):
+        with patch("ai_loop.core.logging.time") as mock_time:
+            mock_time.time.return_value = 1_700_000_000.5
+            mock_time.localtime = time.localtime
+            mock_time.strftime.side_effect = time.strftime
+            log("API", "one")
+            log("API", "two")
+        flush_logs()
+
+        assert mock_time.strftime.call_count == 1
+        expected = time.strftime("%H:%M:%S", time.localtime(1_700_000_000))
+        assert capsys.readouterr().err.splitlines() == [
+            f"[{expected}] [API] one",
+            f"[{expected}] [API] two",
+        ]
+
+    def test_log_lines_queued_as_one_block(self, capsys):
+        from ai_loop.core import logging as logging_module
+
+        with patch.object(logging_module, "_log_queue", wraps=logging_module._log_queue) as q:
+            logging_module.log_lines("PIPELINE", ["Starting run for LIN-1", "Run ID: run-1"])
+        q.put.assert_called_once()
+        flush_logs()
+
+        lines = capsys.readouterr().err.splitlines()
+        assert [line[11:] for line in lines] == [
+            "[PIPELINE] Starting run for LIN-1",
+            "[PIPELINE] Run ID: run-1",
+        ]
+
+    def test_console_output_follows_queued_lines(self, monkeypatch):
+        terminal = io.StringIO()
+
+        class SlowStderr:
+            def write(self, text):
+                time.sleep(0.05)  # Writer thread lags behind the caller
+                terminal.write(text)
+
+            def flush(self):
+                pass
+
+        monkeypatch.setattr(sys, "stdout", terminal)
+        monkeypatch.setattr(sys, "stderr", SlowStderr())
+
+        log("PIPELINE", "logged first")
+        get_console().print("printed second")
+
+        lines = terminal.getvalue().splitlines()
+        assert lines[0].endswith("[PIPELINE] logged first")
+        assert lines[1] == "printed second"
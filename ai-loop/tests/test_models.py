@@ -0,0 +1,131 @@
+"""Tests for pipeline data models."""
+
+import dataclasses
+
+import pytest
+
+from ai_loop.core.models import LinearIssue, PlanVersion
+
+
+@pytest.fixture
+def issue():
+    return LinearIssue(
+        id="issue-123",
+        identifier="LIN-123",
+        title="Add user authentication flow",
+        description="Implement login",
+        state="Todo",
+        priority=2,
+        team_id="team-456",
+        team_name="Engineering",
+        labels=["auth", "backend"],
+    )
+
+
+class TestLinearIssue:
+    """Tests for LinearIssue."""
+
+    def test_issue_pack_cached(self, issue):
+        pack = issue.issue_pack
+        assert pack.startswith("# Issue: LIN-123\n")
+        assert "**Labels:** auth, backend" in pack
+        assert pack.endswith("## Description\n\nImplement login")
+        assert issue.issue_pack is pack
+        assert issue.to_issue_pack() is pack
+
+    def test_frozen(self, issue):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            issue.title = "Changed"
+
+    def test_replace_rebuilds_pack(self, issue):
+        issue.issue_pack
+        changed = dataclasses.replace(issue, description=None)
+        assert changed.issue_pack.endswith("_No description_")
+
+
+class TestPlanVersion:
+    """Tests for PlanVersion."""
+
+    def test_hash_is_stable_16_hex_chars(self):
+        plan = PlanVersion(version=1, content="# Plan\n\n1. Do the thing")
+        assert len(plan.hash) == 16
+        int(plan.hash, 16)
+        assert PlanVersion(version=2, content=plan.content).hash == plan.hash
+        assert PlanVersion(version=2, content=plan.content + ".").hash != plan.hash
+
+    def test_stdlib_fallback(self, monkeypatch):
+        from ai_loop.core import models
+
+        monkeypatch.setattr(models, "xxhash", None)
+        plan = PlanVersion(version=1, content="# Plan")
+        assert len(plan.hash) == 16
+
+
+class TestSerialization:
+    """Tests for pre-formatted timestamps."""
+
+    def test_trace_event_timestamp_formatted_once(self):
+        from datetime import datetime
+
+        from ai_loop.core.models import TraceEvent
+
+        event = TraceEvent(datetime(2025, 1, 1, 10, 0, 0), "pipeline_started", "pending", {})
+        assert event.to_dict()["timestamp"] == "2025-01-01T10:00:00"
+        assert event.to_dict()["timestamp"] is event.timestamp_iso
+        assert TraceEvent.from_dict(event.to_dict()) == event
+
+    def test_run_summary_optional_timestamps(self):
+        from datetime import datetime
+
+        from ai_loop.core.models import RunStatus, RunSummary
+
+        summary = RunSummary(
+            run_id="run-1",
+            issue_identifier="LIN-1",
+            issue_title="First",
+            status=RunStatus.PLANNING,
+            iterations=0,
+            final_confidence=None,
+            branch_name="",
+            started_at=datetime(2025, 1, 1, 10, 0, 0),
+            completed_at=None,
+        )
+        data = summary.to_dict()
+        assert data["started_at"] == "2025-01-01T10:00:00"
+        assert data["completed_at"] is None
+
+    def test_run_summary_native_encoding_matches_to_dict(self, monkeypatch):
+        import json
+        from datetime import datetime
+
+        from ai_loop.core import fastjson
+        from ai_loop.core.models import RunStatus, RunSummary
+
+        pytest.importorskip("orjson")
+        summary = RunSummary(
+            run_id="run-1",
+            issue_identifier="LIN-1",
+            issue_title="First",
+            status=RunStatus.SUCCESS,
+            iterations=2,
+            final_confidence=97,
+            branch_name="agent/lin-1",
+            started_at=datetime(2025, 1, 1, 10, 0, 0, 123456),
+            completed_at=datetime(2025, 1, 1, 10, 5, 0),
+        )
+        native = fastjson.dumps(summary, indent=True)
+        monkeypatch.setattr(fastjson, "orjson", None)
+        fallback = fastjson.dumps(summary, indent=True)
+
+        assert json.loads(native) == json.loads(fallback) == summary.to_dict()
+        assert list(json.loads(native)) == list(summary.to_dict())
+
+
+def test_run_status_is_its_value():
+    import json
+
+    from ai_loop.core.models import RunStatus
+
+    assert RunStatus.SUCCESS == "success"
+    assert f"{RunStatus.CODE_GATE}" == str(RunStatus.CODE_GATE) == "code_gate"
+    assert json.dumps({"status": RunStatus.STUCK}) == '{"status": "stuck"}'
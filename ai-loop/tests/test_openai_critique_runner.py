@@ -0,0 +1,57 @@
+"""Tests for the OpenAI critique runner."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ai_loop.config import get_prompts_dir, get_schemas_dir
+from ai_loop.core.models import LinearIssue, RunContext
+from ai_loop.integrations.openai_critique_runner import OpenAICritiqueRunner
+
+
+@pytest.fixture
+def runner():
+    # Skip settings/client construction; the API call is mocked
+    runner = OpenAICritiqueRunner.__new__(OpenAICritiqueRunner)
+    runner.client = MagicMock()
+    runner.client.responses.create = AsyncMock(
+        return_value=SimpleNamespace(output_text='{"approved": true, "confidence": 97}')
+    )
+    runner.model = "test-model"
+    runner.prompts_dir = get_prompts_dir()
+    runner.schemas_dir = get_schemas_dir()
+    runner.max_concurrent = 3
+    return runner
+
+
+@pytest.fixture
+def ctx(tmp_path):
+    issue = LinearIssue(
+        id="issue-123",
+        identifier="LIN-123",
+        title="Add user authentication flow",
+        description="Implement login",
+        state="Todo",
+        priority=2,
+        team_id="team-456",
+        team_name="Engineering",
+    )
+    return RunContext(run_id="run", issue=issue, repo_root=tmp_path, artifacts_dir=tmp_path)
+
+
+class TestPromptCacheKey:
+    """Tests for routing related critique requests to a shared prefix cache."""
+
+    @pytest.mark.asyncio
+    async def test_key_stable_across_versions_of_a_gate(self, runner, ctx):
+        await runner.plan_gate("# Issue", "# Plan v1", 1, ctx)
+        await runner.plan_gate("# Issue", "# Plan v2", 2, ctx)
+        await runner.code_gate("# Plan", "diff", None, 0, ctx)
+
+        keys = [
+            call.kwargs["extra_body"]["prompt_cache_key"]
+            for call in runner.client.responses.create.await_args_list
+        ]
+        assert keys[0] == keys[1] == "ai-loop:plan_gate:LIN-123"
+        assert keys[2] == "ai-loop:code_gate:LIN-123"
@@ -0,0 +1,257 @@
+"""Tests for pipeline orchestration helpers."""
+
+import asyncio
+import json
+import re
+import subprocess
+import sys
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ai_loop.config import get_settings
+from ai_loop.core import orchestrator as orchestrator_module
+from ai_loop.core.artifacts import ArtifactManager
+from ai_loop.core.models import CritiqueResult, LinearIssue, PlanVersion, RunContext
+from ai_loop.core.orchestrator import PipelineOrchestrator
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    # Skip git/API clients; tests set up only what they exercise
+    orch = PipelineOrchestrator.__new__(PipelineOrchestrator)
+    orch.artifacts_root = tmp_path / "artifacts"
+    orch._linear = orch._claude = orch._critique = None
+    return orch
+
+
+@pytest.fixture
+def ctx(orchestrator, tmp_path):
+    issue = LinearIssue(
+        id="issue-123",
+        identifier="LIN-123",
+        title="Add user authentication flow",
+        description="Implement login",
+        state="Todo",
+        priority=2,
+        team_id="team-456",
+        team_name="Engineering",
+    )
+    run_id = "lin-123-20250101-000000-abcdef"
+    run_dir = orchestrator.artifacts_root / run_id
+    run_dir.mkdir(parents=True)
+    return RunContext(run_id=run_id, issue=issue, repo_root=tmp_path, artifacts_dir=run_dir)
+
+
+@pytest.fixture
+def critique():
+    return CritiqueResult(
+        approved=False,
+        confidence=80,
+        blockers=["Missing tests"],
+        feedback="Add tests",
+    )
+
+
+class TestGateResolution:
+    """Tests for waiting on human gate decisions."""
+
+    async def _resolve_after_delay(self, ctx, delay=0.2):
+        await asyncio.sleep(delay)
+        (ctx.artifacts_dir / "gate_resolution.json").write_text(
+            json.dumps({"action": "request_changes", "feedback": "Split the PR"})
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_watcher", [True, False])
+    async def test_returns_action_when_resolution_written(
+        self, orchestrator, ctx, critique, monkeypatch, use_watcher
+    ):
+        if use_watcher:
+            pytest.importorskip("watchfiles")
+            monkeypatch.setattr(orchestrator_module, "GATE_WATCH_SAFETY_INTERVAL", 30)
+        else:
+            monkeypatch.setattr(orchestrator_module, "watchfiles", None)
+            monkeypatch.setattr(orchestrator_module, "GATE_POLL_INTERVAL", 0.05)
+
+        events = []
+        resolver = asyncio.create_task(self._resolve_after_delay(ctx))
+        action = await asyncio.wait_for(
+            orchestrator._wait_for_gate_resolution(
+                ctx, "plan_gate", critique, lambda t, d=None: events.append(t)
+            ),
+            timeout=10,
+        )
+        await resolver
+
+        assert action == "request_changes"
+        assert ctx.human_feedback == "Split the PR"
+        assert events == ["gate_pending", "gate_resolved"]
+        assert not (ctx.artifacts_dir / "gate_pending.json").exists()
+        assert not (ctx.artifacts_dir / "gate_resolution.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_times_out_to_reject(self, orchestrator, ctx, critique, monkeypatch):
+        monkeypatch.setattr(orchestrator_module, "GATE_RESOLUTION_TIMEOUT", 0.1)
+        monkeypatch.setattr(orchestrator_module, "GATE_POLL_INTERVAL", 0.05)
+
+        action = await asyncio.wait_for(
+            orchestrator._wait_for_gate_resolution(ctx, "code_gate", critique, lambda *a: None),
+            timeout=10,
+        )
+        assert action == "reject"
+        assert ctx.human_feedback == "Timed out (30m)"
+
+    @pytest.mark.asyncio
+    async def test_poll_backs_off_to_cap(self, orchestrator, ctx, critique, monkeypatch):
+        monkeypatch.setattr(orchestrator_module, "watchfiles", None)
+        timeouts = []
+
+        async def fake_wait_for(aw, timeout):
+            aw.close()
+            timeouts.append(timeout)
+            if len(timeouts) == 12:
+                await self._resolve_after_delay(ctx, delay=0)
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(orchestrator_module.asyncio, "wait_for", fake_wait_for)
+        await orchestrator._wait_for_gate_resolution(ctx, "plan_gate", critique, lambda *a: None)
+
+        assert timeouts[0] == pytest.approx(0.1)
+        assert timeouts[1] == pytest.approx(0.16)
+        assert timeouts == sorted(timeouts)
+        assert timeouts[-1] == orchestrator_module.GATE_POLL_INTERVAL_MAX
+
+
+class TestSanitizeIssue:
+    """Tests for issue sanitization."""
+
+    def test_copies_unchanged_fields_and_limits_labels(self, orchestrator, ctx):
+        issue = replace(ctx.issue, labels=[f"label-{i}" for i in range(15)], url="https://x")
+        safe = orchestrator._sanitize_issue(issue)
+
+        assert safe is not issue
+        assert safe.labels == issue.labels[:10]
+        assert (safe.id, safe.team_name, safe.url) == (issue.id, issue.team_name, issue.url)
+
+
+class TestCreateContext:
+    """Tests for run context creation."""
+
+    @pytest.mark.asyncio
+    async def test_context_holds_sanitized_issue(self, orchestrator, ctx, tmp_path, monkeypatch):
+        orchestrator.artifacts = ArtifactManager(orchestrator.artifacts_root)
+        orchestrator.git = MagicMock()
+        orchestrator.git.generate_branch_name.return_value = "agent/lin-123"
+        orchestrator.repo_root = tmp_path
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        issue = replace(ctx.issue, description="Run $(rm -rf /) first")
+
+        new_ctx = await orchestrator.create_context(issue)
+        assert "[FILTERED:subshell]" in new_ctx.issue.description
+        assert "[FILTERED:subshell]" in new_ctx.issue.issue_pack
+        assert new_ctx.issue.identifier == issue.identifier
+        assert orchestrator._linear is None  # Dry run: no writeback client
+        orchestrator.artifacts.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_openai_key_fails_before_setup(self, orchestrator, ctx, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setattr(get_settings(), "openai_api_key", None)
+        orchestrator.git = MagicMock()
+
+        with pytest.raises(Exception, match="api_key"):
+            await orchestrator.create_context(ctx.issue)
+        orchestrator.git.generate_branch_name.assert_not_called()
+
+
+class TestRetryLikely:
+    """Tests for deciding when to pre-start Claude for another round."""
+
+    def test_only_after_two_failed_gates(self, orchestrator, critique):
+        passed = CritiqueResult(approved=True, confidence=99, blockers=[], feedback="")
+        assert not orchestrator._retry_likely([critique], 97)
+        assert not orchestrator._retry_likely([passed, critique], 97)
+        assert orchestrator._retry_likely([passed, critique, critique], 97)
+
+
+class TestDetectStuck:
+    """Tests for repeated-plan detection."""
+
+    def test_stuck_after_three_identical_plans(self, orchestrator, ctx):
+        ctx.add_plan_version(PlanVersion(version=1, content="# Plan A"))
+        for version in (2, 3):
+            assert not orchestrator._detect_stuck(ctx)
+            ctx.add_plan_version(PlanVersion(version=version, content="# Plan B"))
+        assert not orchestrator._detect_stuck(ctx)  # A, B, B
+
+        ctx.add_plan_version(PlanVersion(version=4, content="# Plan B"))
+        assert orchestrator._detect_stuck(ctx)
+        assert len(ctx.plan_versions) == 4
+
+
+def test_import_does_not_load_api_clients():
+    code = "import sys, ai_loop.core.orchestrator; print('openai' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+class TestGatherOrCancel:
+    """Tests for running pipeline steps side by side."""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_order(self):
+        async def value(v, delay):
+            await asyncio.sleep(delay)
+            return v
+
+        results = await orchestrator_module._gather_or_cancel(value("plan", 0.02), value(None, 0))
+        assert results == ["plan", None]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_siblings(self):
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fail():
+            raise RuntimeError("Git error: branch exists")
+
+        with pytest.raises(RuntimeError, match="branch exists"):
+            await asyncio.wait_for(orchestrator_module._gather_or_cancel(slow(), fail()), 5)
+        assert cancelled.is_set()
+
+
+class TestWatchForFile:
+    """Tests for the filesystem watcher behind gate resolution."""
+
+    @pytest.mark.asyncio
+    async def test_ignores_other_files_in_run_dir(self, ctx):
+        pytest.importorskip("watchfiles")
+        changed = asyncio.Event()
+        watcher = asyncio.create_task(
+            PipelineOrchestrator._watch_for_file(ctx.gate_resolution_path, changed)
+        )
+        try:
+            await asyncio.sleep(0.3)  # Let the watcher start
+            (ctx.artifacts_dir / "trace.jsonl").write_text("{}\n")
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(changed.wait(), timeout=0.5)
+
+            ctx.gate_resolution_path.write_text("{}")
+            await asyncio.wait_for(changed.wait(), timeout=5)
+        finally:
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+
+
+def test_generate_run_id_format(orchestrator):
+    run_id = orchestrator._generate_run_id("Team/LIN-123")
+    assert re.fullmatch(r"team-lin-123-\d{8}-\d{6}-[0-9a-f]{6}", run_id)
+    assert orchestrator._generate_run_id("LIN-123") != orchestrator._generate_run_id("LIN-123")
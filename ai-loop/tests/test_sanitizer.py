@@ -6,6 +6,7 @@ from ai_loop.safety.sanitizer import (
     MAX_CONTENT_LENGTH,
     escape_for_shell,
     is_safe_path,
+    safe_identifier,
     sanitize_issue_content,
     sanitize_issue_title,
 )
@@ -109,6 +110,15 @@ class TestSanitizeIssueTitle:
         assert "$(whoami)" not in result
 
 
+class TestSafeIdentifier:
+    """Tests for safe_identifier."""
+
+    def test_lowercases_and_replaces_separators(self):
+        assert safe_identifier("LIN-123") == "lin-123"
+        assert safe_identifier("Team/LIN-123") == "team-lin-123"
+        assert safe_identifier("Team\\LIN-123") == "team-lin-123"
+
+
 class TestEscapeForShell:
     """Tests for escape_for_shell."""
 
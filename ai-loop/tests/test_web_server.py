@@ -0,0 +1,39 @@
+"""Tests for dashboard server helpers."""
+
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from ai_loop.web.server import _wait_for_exit
+
+
+class TestWaitForExit:
+    """Tests for _wait_for_exit."""
+
+    def test_returns_once_process_exits(self):
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        reaper = None
+        try:
+            proc.send_signal(signal.SIGTERM)
+            start = time.monotonic()
+            # Reap concurrently, as the owning parent would
+            reaper = threading.Thread(target=proc.wait)
+            reaper.start()
+            _wait_for_exit([proc.pid], timeout=5)
+            assert time.monotonic() - start < 2
+        finally:
+            proc.kill()
+            if reaper is not None:
+                reaper.join()
+
+    def test_gives_up_after_timeout(self):
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            start = time.monotonic()
+            _wait_for_exit([proc.pid], timeout=0.2)
+            assert 0.2 <= time.monotonic() - start < 1
+        finally:
+            proc.kill()
+            proc.wait()